@@ -15,7 +15,7 @@ Advanced strategy tips:
 
   - The GameState.map object can be manually manipulated to create hypothetical 
   board states. Though, we recommended making a copy of the map to preserve 
-  the actual current map state.
+  the actual current map state. GameMap.fork() makes a cheap copy for this.
 """
 
 
@@ -141,39 +141,9 @@ class AlgoStrategy(gamelib.AlgoCore):
             if unit and unit.unit_type == DESTRUCTOR:
                 destructors_r.append(game_state.contains_stationary_unit(y))
 
-        left_side = []
-        for y in range(14):
-            for x in range(14):
-                if game_state.game_map.in_arena_bounds((x, y + 14)):
-                    left_side.append([x, y + 14])
-        right_side = []
-        for y in range(14):
-            for x in range(14, 28):
-                if game_state.game_map.in_arena_bounds((x, y + 14)):
-                    right_side.append([x, y + 14])
-        filters_left_side = []
-        filters_right_side = []
-        destructors_left_side = []
-        destructors_right_side = []
-        for x in left_side:
-            unit = game_state.contains_stationary_unit(x)
-            if unit and unit.unit_type == FILTER:
-                filters_left_side.append(game_state.contains_stationary_unit(x))
-            elif unit and unit.unit_type == DESTRUCTOR:
-                destructors_left_side.append(game_state.contains_stationary_unit(x))
-            else:
-                pass
-        for x in right_side:
-            unit = game_state.contains_stationary_unit(x)
-            if unit and unit.unit_type == FILTER:
-                filters_right_side.append(game_state.contains_stationary_unit(x))
-            elif unit and unit.unit_type == DESTRUCTOR:
-                destructors_right_side.append(game_state.contains_stationary_unit(x))
-            else:
-                pass
-
-        right_value = len(filters_right_side) + 3 * len(destructors_right_side)
-        left_value = len(filters_left_side) + 3 * len(destructors_left_side)
+        # Weigh the structures in each half of the enemy side
+        right_value = game_state.weighted_region_sum(14, 14, 27, 27, {FILTER: 1, DESTRUCTOR: 3})
+        left_value = game_state.weighted_region_sum(0, 14, 13, 27, {FILTER: 1, DESTRUCTOR: 3})
         left = len(filters_in_primary_l) + len(filters_in_secondary_l) + 3 * len(destructors_l)
         right = len(filters_in_primary_r) + len(filters_in_secondary_r) + 3 * len(destructors_r)
         right_value_no_corner = right_value - right
@@ -216,29 +186,29 @@ class AlgoStrategy(gamelib.AlgoCore):
 
         # Place destructors that attack enemy units
         destructor_locations = [[5, 10], [22, 10]]
-        # attempt_spawn will try to spawn units if we have resources, and will check if a blocking unit is already there
-        game_state.attempt_spawn(DESTRUCTOR, destructor_locations)
         primary_filters = [[0, 13], [1, 13], [26, 13], [27, 13], [2, 12], [25, 12], [3, 11], [5, 11], [6, 11], [21, 11],
                            [22, 11], [24, 11]]
-        game_state.attempt_spawn(FILTER, primary_filters)
         primary_destructors = [[5, 10], [22, 10]]
-        game_state.attempt_spawn(DESTRUCTOR, primary_destructors)
         secondary_filters = [[8, 7], [19, 7], [9, 6], [18, 6], [10, 5], [12, 5], [13, 5], [14, 5], [15, 5], [17, 5],
                              [11, 4], [16, 4]]
-        game_state.attempt_spawn(FILTER, secondary_filters)
-        game_state.attempt_upgrade(primary_filters)
-
         tertiary_filters = [[7, 8], [6, 9], [20, 8], [21, 9]]
-        game_state.attempt_spawn(FILTER, tertiary_filters)
         secondary_destructors = [[1, 12], [26, 12]]
-        game_state.attempt_spawn(DESTRUCTOR, secondary_destructors)
-        dmgs = self.turn_damage(game_state)
         tertiary_destructors = [[2, 11], [25, 11], [6, 10], [21, 10], [3, 10], [24, 10]]
-        game_state.attempt_spawn(DESTRUCTOR, tertiary_destructors)
-        game_state.attempt_upgrade(primary_destructors + secondary_destructors + tertiary_destructors)
-        game_state.attempt_upgrade(secondary_filters + tertiary_filters)
         encryptorlocs = [[13, 3], [14, 3], [13, 2], [14, 2], [13, 1], [14, 1]]
-        game_state.attempt_spawn(ENCRYPTOR, encryptorlocs)
+        # attempt_plan runs the actions in order, spawning units if we have resources and checking if a blocking unit is already there
+        game_state.attempt_plan([
+            ("spawn", DESTRUCTOR, destructor_locations),
+            ("spawn", FILTER, primary_filters),
+            ("spawn", DESTRUCTOR, primary_destructors),
+            ("spawn", FILTER, secondary_filters),
+            ("upgrade", None, primary_filters),
+            ("spawn", FILTER, tertiary_filters),
+            ("spawn", DESTRUCTOR, secondary_destructors),
+            ("spawn", DESTRUCTOR, tertiary_destructors),
+            ("upgrade", None, primary_destructors + secondary_destructors + tertiary_destructors),
+            ("upgrade", None, secondary_filters + tertiary_filters),
+            ("spawn", ENCRYPTOR, encryptorlocs)])
+        dmgs = self.turn_damage(game_state)
         if sum(dmgs) < 20:
             game_state.attempt_spawn(ENCRYPTOR, encryptorlocs)
         else:
@@ -319,11 +289,8 @@ class AlgoStrategy(gamelib.AlgoCore):
         # Get the damage estimate each path will take
         for location in location_options:
             path = game_state.find_path_to_edge(location)
-            damage = 0
-            for path_location in path:
-                # Get number of enemy destructors that can attack the final location and multiply by destructor damage
-                damage += len(game_state.get_attackers(path_location, 0)) * gamelib.GameUnit(DESTRUCTOR,
-                                                                                             game_state.config).damage_i
+            # Sum the damage per frame enemy destructors deal at each location along the path
+            damage = game_state.game_map.path_damage(path, 1)
             damages.append(damage)
 
         # Now just return the location that takes the least damage
@@ -331,12 +298,11 @@ class AlgoStrategy(gamelib.AlgoCore):
 
     def detect_enemy_unit(self, game_state, unit_type=None, valid_x=None, valid_y=None):
         total_units = 0
-        for location in game_state.game_map:
-            if game_state.contains_stationary_unit(location):
-                for unit in game_state.game_map[location]:
-                    if unit.player_index == 1 and (unit_type is None or unit.unit_type == unit_type) and (
-                            valid_x is None or location[0] in valid_x) and (valid_y is None or location[1] in valid_y):
-                        total_units += 1
+        for location in game_state.game_map.occupied_locations(player_index=1, stationary=True):
+            for unit in game_state.game_map[location]:
+                if unit.player_index == 1 and (unit_type is None or unit.unit_type == unit_type) and (
+                        valid_x is None or location[0] in valid_x) and (valid_y is None or location[1] in valid_y):
+                    total_units += 1
         return total_units
 
     def filter_blocked_locations(self, locations, game_state):
@@ -10,6 +10,9 @@ Investigating it is useful for any player that wants to access more information
 The GameUnit class in unit.py represetns a single unit. 
 Investigating it is useful for any player that wants to access information about units. \n
 
+The UnitCatalog class in catalog.py holds the unit information from the config, compiled once at the start of the game. 
+GameState, GameMap and GameUnit read unit stats and costs from it. \n
+
 The AlgoCore class in algocore.py handles communication with the game engine, and forms the bones of an algo. AlgoStrategy inherits from it. 
 Investigating it is useful for advanced players interested in getting data from the action phase or communicating directly with the game engine. \n
 
@@ -24,6 +27,7 @@ from .util import debug_write
 from .game_state import GameState
 from .unit import GameUnit
 from .game_map import GameMap
+from .catalog import UnitCatalog, get_catalog
 
-__all__ = ["algocore", "game_state", "game_map", "navigation", "unit", "util"]
+__all__ = ["algocore", "game_state", "game_map", "navigation", "unit", "util", "catalog"]
  
\ No newline at end of file
@@ -1,6 +1,7 @@
 import json
 
 from .game_state import GameState
+from .catalog import get_catalog
 from .util import get_command, debug_write, BANNER_TEXT, send_command
 
 class AlgoCore(object):
@@ -10,10 +11,12 @@ class AlgoCore(object):
 
     Attributes :
         * config (JSON): json object containing information about the game
+        * catalog (:obj: UnitCatalog): The unit information compiled from the config at the start of the game
 
     """
     def __init__(self):
         self.config = None
+        self.catalog = None
 
     def on_game_start(self, config):
         """
@@ -62,6 +65,7 @@ class AlgoCore(object):
                 This means this must be the config file. So, load in the config file as a json and add it to your AlgoStrategy class.
                 """
                 parsed_config = json.loads(game_state_string)
+                self.catalog = get_catalog(parsed_config)
                 self.on_game_start(parsed_config)
             elif "turnInfo" in game_state_string:
                 state = json.loads(game_state_string)
@@ -0,0 +1,171 @@
+from collections import namedtuple
+from types import MappingProxyType
+
+
+UnitStats = namedtuple("UnitStats", [
+    "unit_type", "type_index", "upgraded", "stationary", "speed", "damage_f", "damage_i", "attackRange",
+    "shieldRange", "max_health", "shieldPerUnit", "shieldBonusPerY", "cost", "refund_percentage", "turns_to_remove",
+    "catalog"])
+UnitStats.__doc__ = """The stats shared by every unit of a type, before or after upgrading.
+
+    The names match the attributes of GameUnit, which reads them from the record it shares with every
+    unit of the same type. cost is a (cores, bits) tuple; for upgraded stats it is the total of the base
+    and upgrade costs. catalog is the UnitCatalog the record belongs to.
+    """
+
+
+class UnitCatalog:
+    """The unit information from the game config, compiled once per game.
+
+    Use get_catalog to get the catalog of a config; it is compiled on the first call and shared afterwards.
+
+    Attributes :
+        * config (JSON): The config the catalog was compiled from
+        * FILTER, ENCRYPTOR, DESTRUCTOR, PING, EMP, SCRAMBLER, REMOVE, UPGRADE (str): The unit type shorthands, None if missing from the config
+        * shorthands (tuple): The unit type shorthands in config order
+        * type_index (mapping): Maps a unit type shorthand to its index in config["unitInformation"]
+        * firewall_types (tuple): The firewall unit types
+        * all_units (tuple): The unit types that can be spawned
+        * hit_radius (float): The radius added to ranges when finding the locations a unit affects
+        * max_attack_range (float): The longest attack range of any unit, upgraded or not
+        * max_shield_range (float): The longest shield range of any unit, upgraded or not
+
+    """
+    NAMES = ("FILTER", "ENCRYPTOR", "DESTRUCTOR", "PING", "EMP", "SCRAMBLER", "REMOVE", "UPGRADE")
+
+    def __init__(self, config):
+        """Compiles the unit information of a config
+
+        Args:
+            config (JSON): Contains information about the game
+
+        """
+        self.config = config
+        unit_information = config["unitInformation"]
+        self.shorthands = tuple(unit_info.get("shorthand") for unit_info in unit_information)
+        self.type_index = MappingProxyType({shorthand: index for index, shorthand in enumerate(self.shorthands)})
+        for index, name in enumerate(self.NAMES):
+            setattr(self, name, self.shorthands[index] if index < len(self.shorthands) else None)
+        self.firewall_types = (self.FILTER, self.ENCRYPTOR, self.DESTRUCTOR)
+        self.all_units = (self.PING, self.EMP, self.SCRAMBLER, self.FILTER, self.ENCRYPTOR, self.DESTRUCTOR)
+        self.hit_radius = unit_information[0].get("getHitRadius", 0.51) if unit_information else 0.51
+
+        stats = {}
+        upgrade_costs = {}
+        for index, unit_info in enumerate(unit_information):
+            base = self.__compile_stats(index, unit_info, False, None)
+            stats[base.unit_type, False] = base
+            upgraded = unit_info.get("upgrade")
+            stats[base.unit_type, True] = base if upgraded is None else self.__compile_stats(index, upgraded, True, base)
+            upgraded = upgraded or {}
+            upgrade_costs[base.unit_type] = (upgraded.get("cost1", base.cost[0]), upgraded.get("cost2", base.cost[1]))
+        self.__stats = MappingProxyType(stats)
+        self.__upgrade_costs = MappingProxyType(upgrade_costs)
+        self.__upgradable = frozenset(unit_info.get("shorthand") for unit_info in unit_information if unit_info.get("upgrade") is not None)
+        self.max_attack_range = max([unit_stats.attackRange for unit_stats in stats.values()], default=0)
+        self.max_shield_range = max([unit_stats.shieldRange for unit_stats in stats.values()], default=0)
+
+    def __compile_stats(self, index, type_config, upgraded, base):
+        """Builds the stats of a unit type from its config entry, or from its upgrade entry applied to the base stats."""
+        if base is None:
+            return UnitStats(
+                unit_type=type_config.get("shorthand"),
+                type_index=index,
+                upgraded=False,
+                stationary=type_config.get("unitCategory") == 0,
+                speed=type_config.get("speed", 0),
+                damage_f=type_config.get("attackDamageTower", 0),
+                damage_i=type_config.get("attackDamageWalker", 0),
+                attackRange=type_config.get("attackRange", 0),
+                shieldRange=type_config.get("shieldRange", 0),
+                max_health=type_config.get("startHealth", 0),
+                shieldPerUnit=type_config.get("shieldPerUnit", 0),
+                shieldBonusPerY=type_config.get("shieldBonusPerY", 0),
+                cost=(type_config.get("cost1", 0), type_config.get("cost2", 0)),
+                refund_percentage=type_config.get("refundPercentage", 0),
+                turns_to_remove=type_config.get("turnsRequiredToRemove", 0),
+                catalog=self)
+        return base._replace(
+            upgraded=upgraded,
+            speed=type_config.get("speed", base.speed),
+            damage_f=type_config.get("attackDamageTower", base.damage_f),
+            damage_i=type_config.get("attackDamageWalker", base.damage_i),
+            attackRange=type_config.get("attackRange", base.attackRange),
+            shieldRange=type_config.get("shieldRange", base.shieldRange),
+            max_health=type_config.get("startHealth", base.max_health),
+            shieldPerUnit=type_config.get("shieldPerUnit", base.shieldPerUnit),
+            shieldBonusPerY=type_config.get("shieldBonusPerY", base.shieldBonusPerY),
+            cost=(type_config.get("cost1", 0) + base.cost[0], type_config.get("cost2", 0) + base.cost[1]),
+            refund_percentage=type_config.get("refundPercentage", base.refund_percentage),
+            turns_to_remove=type_config.get("turnsRequiredToRemove", base.turns_to_remove))
+
+    def stats(self, unit_type, upgraded=False):
+        """Gets the stats of a unit type
+
+        Args:
+            unit_type: A unit type shorthand
+            upgraded: Whether to get the stats of an upgraded unit
+
+        Returns:
+            A UnitStats record. A unit type without an upgrade has the same stats when upgraded.
+
+        """
+        return self.__stats[unit_type, bool(upgraded)]
+
+    def is_stationary(self, unit_type):
+        """
+            Returns:
+                Boolean, True if the unit type is a firewall
+        """
+        return unit_type in self.firewall_types
+
+    def can_upgrade(self, unit_type):
+        """
+            Returns:
+                Boolean, True if the config has an upgrade for the unit type
+        """
+        return unit_type in self.__upgradable
+
+    def cost(self, unit_type, upgrade=False):
+        """Gets the cost of a unit type, or of upgrading it
+
+        Args:
+            unit_type: A unit type shorthand
+            upgrade: If True, the cost of the upgrade alone. A resource missing from the upgrade costs the same as the base unit.
+
+        Returns:
+            The costs as a list [CORES, BITS]
+
+        """
+        if upgrade:
+            return list(self.__upgrade_costs[unit_type])
+        return list(self.__stats[unit_type, False].cost)
+
+    def refund(self, unit_type, upgraded=False):
+        """Gets the cores returned when removing a firewall at full health
+
+        Returns:
+            The refund percentage of the unit type applied to its total cores cost
+
+        """
+        stats = self.__stats[unit_type, bool(upgraded)]
+        return stats.cost[0] * stats.refund_percentage
+
+
+_catalog = None
+
+
+def get_catalog(config):
+    """Gets the compiled catalog of a config, compiling it if the config is not the one compiled last
+
+    Args:
+        config (JSON): Contains information about the game
+
+    Returns:
+        The UnitCatalog of the config
+
+    """
+    global _catalog
+    if _catalog is None or _catalog.config is not config:
+        _catalog = UnitCatalog(config)
+    return _catalog
@@ -1,7 +1,167 @@
 import math
+import copy
+from array import array
+from operator import attrgetter
 from .unit import GameUnit
+from .catalog import get_catalog
 from .util import debug_write
 
+def _in_diamond(x, y, arena_size):
+    """Checks the diamond arithmetic for a single location, see GameMap.in_arena_bounds
+    """
+    half_board = arena_size // 2
+
+    row_size = y + 1
+    startx = half_board - row_size
+    endx = startx + (2 * row_size) - 1
+    top_half_check = (y < half_board and x >= startx and x <= endx)
+
+    row_size = (arena_size - 1 - y) + 1
+    startx = half_board - row_size
+    endx = startx + (2 * row_size) - 1
+    bottom_half_check = (y >= half_board and x >= startx and x <= endx)
+
+    return bottom_half_check or top_half_check
+
+
+_MASK_64 = (1 << 64) - 1
+
+def _zobrist_key(*parts):
+    """Gets a fixed pseudo-random 64 bit key for a tuple of non-negative integers by chaining splitmix64.
+    The keys only depend on their arguments, so board hashes are stable across turns and processes.
+    """
+    value = 0
+    for part in parts:
+        value = (value ^ part) + 0x9E3779B97F4A7C15 & _MASK_64
+        value = (value ^ (value >> 30)) * 0xBF58476D1CE4E5B9 & _MASK_64
+        value = (value ^ (value >> 27)) * 0x94D049BB133111EB & _MASK_64
+        value ^= value >> 31
+    return value
+
+
+class _ArenaGeometry:
+    """Board data that only depends on the arena size, built once and shared by every GameMap
+
+    Attributes :
+        * arena_size (int): The size of the arena
+        * mask (tuple): mask[x][y] is True if [x, y] is inside the diamond shaped board
+        * locations (tuple): Every (x, y) location on the board, row by row from the bottom
+        * rank (tuple): rank[x * arena_size + y] is the position of [x, y] in locations, None when off the board
+        * edges (tuple): The (x, y) locations of each edge, indexed like GameMap.get_edges
+        * edge_sets (tuple): The same locations as one frozenset per edge
+        * friendly_spawn_edge (frozenset): The locations of the bottom left and bottom right edges
+        * region_bits (dict): Bitboards of named regions, see GameMap.get_region_bits
+
+    """
+    def __init__(self, arena_size):
+        self.arena_size = arena_size
+        self.mask = tuple(tuple(_in_diamond(x, y, arena_size) for y in range(arena_size)) for x in range(arena_size))
+
+        half_arena = arena_size // 2
+        top_right = tuple((half_arena + num, arena_size - 1 - num) for num in range(half_arena))
+        top_left = tuple((half_arena - 1 - num, arena_size - 1 - num) for num in range(half_arena))
+        bottom_left = tuple((half_arena - 1 - num, num) for num in range(half_arena))
+        bottom_right = tuple((half_arena + num, num) for num in range(half_arena))
+        self.locations = tuple((x, y) for y in range(arena_size) for x in range(arena_size) if self.mask[x][y])
+        rank = [None] * (arena_size * arena_size)
+        for cell_id, (x, y) in enumerate(self.locations):
+            rank[x * arena_size + y] = cell_id
+        self.rank = tuple(rank)
+
+        self.edges = (top_right, top_left, bottom_left, bottom_right)
+        self.edge_sets = tuple(frozenset(edge) for edge in self.edges)
+        self.friendly_spawn_edge = frozenset(bottom_left + bottom_right)
+
+        corner_width = half_arena // 3
+        self.region_bits = {
+            "bottom_half": self.location_bits(location for location in self.locations if location[1] < half_arena),
+            "top_half": self.location_bits(location for location in self.locations if location[1] >= half_arena),
+            "left_half": self.location_bits(location for location in self.locations if location[0] < half_arena),
+            "right_half": self.location_bits(location for location in self.locations if location[0] >= half_arena),
+            "left_corner": self.location_bits(location for location in self.locations if location[0] <= corner_width),
+            "right_corner": self.location_bits(location for location in self.locations if location[0] >= arena_size - 1 - corner_width),
+            "top_right_edge": self.location_bits(top_right),
+            "top_left_edge": self.location_bits(top_left),
+            "bottom_left_edge": self.location_bits(bottom_left),
+            "bottom_right_edge": self.location_bits(bottom_right)
+        }
+        self.__clipped_stencils = {}
+        self.__distance_table = None
+        self.__distance_view = None
+
+    def distance_table(self):
+        """Gets the float64 table of euclidean distances between every pair of on-board locations, building it on first use.
+        Each entry is the same math.sqrt of an integer distance_between_locations computes, so thresholds compare exactly.
+        The distance between the locations with ranks a and b is at a * len(locations) + b.
+        """
+        if self.__distance_table is None:
+            locations = self.locations
+            span = 2 * self.arena_size
+            roots = [math.sqrt(squared) for squared in range(span * span)]
+            self.__distance_table = array('d', (roots[(x1 - x2) ** 2 + (y1 - y2) ** 2] for x1, y1 in locations for x2, y2 in locations))
+        return self.__distance_table
+
+    def distance_view(self):
+        """A read-only memoryview of distance_table, shared so rows can be sliced out without copying
+        """
+        if self.__distance_view is None:
+            self.__distance_view = memoryview(self.distance_table()).toreadonly()
+        return self.__distance_view
+
+    def location_bits(self, locations):
+        """Builds a bitboard with the bit rank[x * arena_size + y] set for every on-board (x, y) in locations
+        """
+        size = self.arena_size
+        bits = 0
+        for x, y in locations:
+            if 0 <= x < size and 0 <= y < size and self.mask[x][y]:
+                bits |= 1 << self.rank[x * size + y]
+        return bits
+
+    def range_stencil(self, radius, get_hit_radius):
+        """Gets the locations within radius + get_hit_radius of every center on the board
+
+        Returns:
+            A tuple indexed by x * arena_size + y of tuples of (x, y) locations, ordered by x then y.
+            Off-board centers hold None.
+        """
+        key = (radius, get_hit_radius)
+        clipped = self.__clipped_stencils.get(key)
+        if clipped is None:
+            clipped = self.__clipped_stencils[key] = self.__build_stencil(radius, get_hit_radius)
+        return clipped
+
+    def offsets_in_range(self, radius, get_hit_radius):
+        """The (dx, dy) offsets within radius + get_hit_radius of the origin, ordered by dx then dy
+        """
+        search_radius = int(math.ceil(radius))
+        return tuple((i, j) for i in range(-search_radius, search_radius + 1) for j in range(-search_radius, search_radius + 1)
+                     if math.sqrt(i ** 2 + j ** 2) < radius + get_hit_radius)
+
+    def __build_stencil(self, radius, get_hit_radius):
+        offsets = self.offsets_in_range(radius, get_hit_radius)
+        size = self.arena_size
+        mask = self.mask
+        clipped = [None] * (size * size)
+        for x in range(size):
+            for y in range(size):
+                if mask[x][y]:
+                    clipped[x * size + y] = tuple((x + i, y + j) for i, j in offsets
+                                                  if 0 <= x + i < size and 0 <= y + j < size and mask[x + i][y + j])
+        return tuple(clipped)
+
+
+_GEOMETRY = {}
+
+def _get_geometry(arena_size):
+    """Returns the shared _ArenaGeometry for an arena size, building it on first use
+    """
+    geometry = _GEOMETRY.get(arena_size)
+    if geometry is None:
+        geometry = _GEOMETRY[arena_size] = _ArenaGeometry(arena_size)
+    return geometry
+
+
 class GameMap:
     """Holds data about the current game map and provides functions
     useful for getting information related to the map.
@@ -9,6 +169,11 @@ class GameMap:
     game_map[x, y] will return a list of Units located at that location, 
     or an empty list if there are no units at the location
 
+    Alongside the unit lists, the map keeps flat structure planes with one entry per cell
+    (see get_structure_planes) and the set of occupied locations (see occupied_locations).
+    They only stay in sync when the map is changed through add_unit, remove_unit, upgrade,
+    set_pending_removal or game_map[x, y] = units.
+
     Attributes :
         * config (JSON): Contains information about the current game rules
         * enable_warnings (bool): If true, debug messages for game_map functions will print out
@@ -35,45 +200,574 @@ class GameMap:
         self.TOP_LEFT = 1
         self.BOTTOM_LEFT = 2
         self.BOTTOM_RIGHT = 3
-        self.__map = self.__empty_grid()
-        self.__start = [13,0]
+        self.__geometry = _get_geometry(self.ARENA_SIZE)
+        self.__arena_mask = self.__geometry.mask
+        self.__cells = [[] for _ in range(self.ARENA_SIZE * self.ARENA_SIZE)]
+        self.__occupied = set()
+        self.__copy_on_write = False
+        self.__owned_units = set()
+        self.__journal = []
+        self.__savepoints = []
+        self.__structure_index = {}
+        self.__board_hash = 0
+        self.__blocking_hash = 0
+        self.__structure_bits = {}
+        self.__structure_version = 0
+        self.__placement_version = 0
+        self.__catalog = get_catalog(self.config)
+        self.__type_index = self.__catalog.type_index
+        self.__init_structure_planes()
+        self.__init_coverage()
     
     def __getitem__(self, location):
         if len(location) == 2 and self.in_arena_bounds(location):
             x,y = location
-            return self.__map[x][y]
+            return self.__cells[x * self.ARENA_SIZE + y]
         self._invalid_coordinates(location)
 
     def __setitem__(self, location, val):
         if type(location) == tuple and len(location) == 2 and self.in_arena_bounds(location):
-            self.__map[location[0]][location[1]] = val
+            self.__write_cell(location[0], location[1], val)
             return
         self._invalid_coordinates(location)
 
     def __iter__(self):
-        self.__start = [13,0]
-        return self
-    
-    def __next__(self):
-        location = self.__start
-        if location == [15,27]:
-            raise StopIteration
-        new_location = [location[0]+1, location[1]]
-        while not self.in_arena_bounds(new_location) and not location == [14,27]:
-            if new_location[0] == self.ARENA_SIZE:
-                new_location = [0, new_location[1]+1]
-            else:
-                new_location = [new_location[0]+1, new_location[1]]
-        self.__start = new_location
-        return location 
-
-    def __empty_grid(self):
-        grid = []
-        for x in range(0, self.ARENA_SIZE):
-            grid.append([])
-            for _ in range(0, self.ARENA_SIZE):
-                grid[x].append([])
-        return grid
+        for x, y in self.__geometry.locations:
+            yield [x, y]
+
+    def occupied_locations(self, player_index=None, stationary=None):
+        """Iterates over the locations that contain units, in the same order as iterating over the map.
+
+        Each call returns an independent generator, so it is safe to nest them.
+        The work done scales with the number of occupied locations rather than the size of the board.
+
+        Args:
+            player_index: If not None, only yield locations holding a unit controlled by this player
+            stationary: If True, only yield locations holding a firewall. If False, only yield locations holding information units
+
+        Returns:
+            A generator of [x, y] locations
+
+        """
+        size = self.ARENA_SIZE
+        for index in sorted(self.__occupied, key=self.__geometry.rank.__getitem__):
+            x, y = divmod(index, size)
+            if player_index is None and stationary is None:
+                yield [x, y]
+                continue
+            for unit in self.__cells[index]:
+                if (player_index is None or unit.player_index == player_index) and (stationary is None or unit.stationary == stationary):
+                    yield [x, y]
+                    break
+
+    def fork(self):
+        """Creates a copy of this map for building hypothetical boards.
+
+        The fork shares every cell and unit with this map. A cell is only copied when either map writes to it,
+        so forking is much cheaper than copy.deepcopy. Changes made to the fork through add_unit, remove_unit,
+        upgrade, set_pending_removal or fork[x, y] = units never affect this map, and vice versa.
+        Modifying the unit lists returned by game_map[x, y] directly is not supported on forked maps.
+
+        Returns:
+            A new GameMap with the same units as this one
+
+        """
+        child = copy.copy(self)
+        child.__cells = list(self.__cells)
+        child.__occupied = set(self.__occupied)
+        child.__structure_index = {key: set(indexes) for key, indexes in self.__structure_index.items()}
+        child.__structure_bits = dict(self.__structure_bits)
+        child.__init_coverage(self)
+        child.__init_structure_planes(self)
+        child.__journal = []
+        child.__savepoints = []
+        self.__copy_on_write = child.__copy_on_write = True
+        self.__owned_units = set()
+        child.__owned_units = set()
+        return child
+
+    def __init_structure_planes(self, source=None):
+        if source is None:
+            cells = self.ARENA_SIZE * self.ARENA_SIZE
+            self._owner_plane = array('b', [-1]) * cells
+            self._type_plane = array('b', [-1]) * cells
+            self._health_plane = array('d', [0.0]) * cells
+            self._upgraded_plane = array('b', [0]) * cells
+            self._pending_removal_plane = array('b', [0]) * cells
+        else:
+            self._owner_plane = array('b', source._owner_plane)
+            self._type_plane = array('b', source._type_plane)
+            self._health_plane = array('d', source._health_plane)
+            self._upgraded_plane = array('b', source._upgraded_plane)
+            self._pending_removal_plane = array('b', source._pending_removal_plane)
+        self.__structure_planes = {
+            "owner": memoryview(self._owner_plane).toreadonly(),
+            "unit_type": memoryview(self._type_plane).toreadonly(),
+            "health": memoryview(self._health_plane).toreadonly(),
+            "upgraded": memoryview(self._upgraded_plane).toreadonly(),
+            "pending_removal": memoryview(self._pending_removal_plane).toreadonly()
+        }
+
+    def begin(self):
+        """Starts recording changes to the map so they can be undone with rollback.
+
+        Every change made through add_unit, remove_unit, upgrade, set_pending_removal or game_map[x, y] = units
+        is recorded until the matching commit or rollback. Calls can be nested, which makes this useful for
+        depth first searches that try a change, evaluate the board, then undo it.
+        """
+        self.__savepoints.append(len(self.__journal))
+        self.__copy_on_write = True
+        self.__owned_units = set()
+
+    def commit(self):
+        """Keeps the changes made since the matching begin. They become part of the enclosing transaction, if any.
+        """
+        if not self.__savepoints:
+            self.warn("Called commit without a matching begin.")
+            return
+        self.__savepoints.pop()
+        if not self.__savepoints:
+            self.__journal = []
+
+    def rollback(self):
+        """Undoes every change made since the matching begin.
+
+        Takes time proportional to the number of changes. The structure planes and other data derived
+        from the units are restored along with them.
+        """
+        if not self.__savepoints:
+            self.warn("Called rollback without a matching begin.")
+            return
+        savepoint = self.__savepoints.pop()
+        journal = self.__journal
+        size = self.ARENA_SIZE
+        while len(journal) > savepoint:
+            index, units = journal.pop()
+            old_units = self.__cells[index]
+            self.__cells[index] = units
+            self.__sync_cell(index // size, index % size, old_units)
+        self.__owned_units = set()
+
+    def __write_cell(self, x, y, units):
+        """Replaces the unit list of a cell. Unit lists are never modified in place, which lets forks
+        and the rollback journal share them.
+        """
+        index = x * self.ARENA_SIZE + y
+        old_units = self.__cells[index]
+        if self.__savepoints:
+            self.__journal.append((index, old_units))
+        self.__cells[index] = units
+        self.__sync_cell(x, y, old_units)
+
+    def __writable_structure(self, location):
+        """Gets the stationary unit at a location so that it can be modified, copying it first if it may be shared
+        """
+        unit = self.__get_structure(location)
+        if unit is None or not self.__copy_on_write or unit in self.__owned_units:
+            return unit
+        x, y = location
+        clone = copy.copy(unit)
+        self.__owned_units.add(clone)
+        self.__write_cell(x, y, [clone if other is unit else other for other in self.__cells[x * self.ARENA_SIZE + y]])
+        return clone
+
+    def __sync_cell(self, x, y, old_units=None):
+        """Rewrites the structure planes, occupancy and hashes for a single cell from the units stored there.
+        old_units is the cell's previous unit list, or None if only the stationary unit changed.
+        """
+        index = x * self.ARENA_SIZE + y
+        units = self.__cells[index]
+        if units:
+            self.__occupied.add(index)
+        else:
+            self.__occupied.discard(index)
+        if old_units is not None:
+            self.__board_hash ^= self.__mobile_hash(index, old_units) ^ self.__mobile_hash(index, units)
+        structure = None
+        for unit in units:
+            if unit.stationary:
+                structure = unit
+
+        old_state = None
+        if self._owner_plane[index] >= 0:
+            old_state = (self._owner_plane[index], self._type_plane[index], bool(self._upgraded_plane[index]),
+                         bool(self._pending_removal_plane[index]), self._health_plane[index])
+        if structure is None:
+            new_state = None
+            self._owner_plane[index] = -1
+            self._type_plane[index] = -1
+            self._health_plane[index] = 0.0
+            self._upgraded_plane[index] = 0
+            self._pending_removal_plane[index] = 0
+        else:
+            new_state = (structure.player_index, self.__type_index[structure.unit_type], bool(structure.upgraded),
+                         bool(structure.pending_removal), float(structure.health))
+            self._owner_plane[index] = structure.player_index
+            self._type_plane[index] = new_state[1]
+            self._health_plane[index] = structure.health
+            self._upgraded_plane[index] = structure.upgraded
+            self._pending_removal_plane[index] = structure.pending_removal
+        if old_state != new_state:
+            self.__structure_changed(index, old_state, new_state)
+
+    def __structure_changed(self, index, old_state, new_state):
+        """Updates the indexes derived from the structure at a cell.
+        States are (player_index, unit type index, upgraded, pending_removal, health) tuples, or None for no structure.
+        """
+        self.__structure_version += 1
+        old_key = None if old_state is None else old_state[:3]
+        new_key = None if new_state is None else new_state[:3]
+        if old_state is not None:
+            self.__board_hash ^= self.__structure_hash(index, old_state)
+        if new_state is not None:
+            self.__board_hash ^= self.__structure_hash(index, new_state)
+        if old_key == new_key:
+            return
+
+        if old_key is not None:
+            self.__structure_index[old_key].discard(index)
+            self.__add_coverage(index, old_key, -1)
+        if new_key is not None:
+            if new_key not in self.__structure_index:
+                self.__structure_index[new_key] = set()
+            self.__structure_index[new_key].add(index)
+            self.__add_coverage(index, new_key, 1)
+
+        if old_key is not None and new_key is not None and old_key[:2] == new_key[:2]:
+            return
+        self.__placement_version += 1
+        bit = 1 << self.__geometry.rank[index]
+        if old_key is not None:
+            self.__structure_bits[old_key[:2]] ^= bit
+        if new_key is not None:
+            self.__structure_bits[new_key[:2]] = self.__structure_bits.get(new_key[:2], 0) | bit
+        if (old_key is None) != (new_key is None):
+            self.__blocking_hash ^= _zobrist_key(index)
+
+    def __unit_stats(self, type_index, upgraded):
+        """Gets the catalog stats of a unit type index, with the upgrade values applied if upgraded
+        """
+        return self.__catalog.stats(self.__catalog.shorthands[type_index], upgraded)
+
+    def __get_hit_radius(self):
+        return self.__catalog.hit_radius
+
+    def __add_coverage(self, index, key, sign):
+        """Adds (sign 1) or removes (sign -1) the damage and shielding a structure gives to information units around it
+        """
+        player_index, type_index, upgraded = key
+        if player_index not in self.__damage_grids:
+            return
+        stats = self.__unit_stats(type_index, upgraded)
+        size = self.ARENA_SIZE
+
+        damage = stats.damage_i
+        if damage > 0 or stats.damage_f > 0:
+            grid = self.__damage_grids[player_index]
+            threats = self.__threat_sources[player_index]
+            damage *= sign
+            for x, y in self.__geometry.range_stencil(stats.attackRange, self.__get_hit_radius())[index]:
+                covered = x * size + y
+                grid[covered] += damage
+                if sign > 0:
+                    threats[covered] = tuple(sorted(threats[covered] + (index,)))
+                else:
+                    threats[covered] = tuple(source for source in threats[covered] if source != index)
+
+        shield = self.__shield_amount(index, key)
+        if shield > 0:
+            grid = self.__shield_grids[player_index]
+            sources = self.__shield_sources[player_index]
+            shield *= sign
+            for x, y in self.__geometry.range_stencil(stats.shieldRange, self.__get_hit_radius())[index]:
+                covered = x * size + y
+                grid[covered] += shield
+                if sign > 0:
+                    sources[covered] = sources[covered] + (index,)
+                else:
+                    sources[covered] = tuple(source for source in sources[covered] if source != index)
+
+    def __shield_amount(self, index, key):
+        """The shield an encryptor gives each friendly information unit, including the bonus for being further forward
+        """
+        player_index, type_index, upgraded = key
+        stats = self.__unit_stats(type_index, upgraded)
+        shield = stats.shieldPerUnit
+        if shield <= 0:
+            return 0
+        y = index % self.ARENA_SIZE
+        forward_y = y if player_index == 0 else self.ARENA_SIZE - 1 - y
+        return shield + stats.shieldBonusPerY * forward_y
+
+    def __whole_cell_index(self, location):
+        """The flat index of a location with whole number coordinates, None if either coordinate has a fractional part.
+        The caller checks that the location is on the board.
+        """
+        x, y = location
+        if x != int(x) or y != int(y):
+            return None
+        return int(x) * self.ARENA_SIZE + int(y)
+
+    def __scan_sources(self, location, player_index, longest_range, get_range, covers):
+        """Finds a player's structures in range of a location that is not a whole cell, by scanning the locations around it.
+        The grids and source lists only hold whole cells, this gives the same answer for any other on-board location.
+
+        Returns:
+            The flat indexes of the structures, ordered by x then y
+        """
+        hit_radius = self.__get_hit_radius()
+        size = self.ARENA_SIZE
+        found = []
+        for x, y in self.get_locations_in_range(location, longest_range):
+            index = x * size + y
+            if self._owner_plane[index] != player_index:
+                continue
+            key = (player_index, self._type_plane[index], bool(self._upgraded_plane[index]))
+            stats = self.__unit_stats(key[1], key[2])
+            if covers(index, key, stats) and self.distance_between_locations(location, [x, y]) < get_range(stats) + hit_radius:
+                found.append(index)
+        return found
+
+    def __scan_attackers(self, location, player_index):
+        return self.__scan_sources(location, player_index, self.__catalog.max_attack_range, attrgetter("attackRange"),
+                                   lambda index, key, stats: stats.damage_i > 0 or stats.damage_f > 0)
+
+    def __scan_encryptors(self, location, player_index):
+        return self.__scan_sources(location, player_index, self.__catalog.max_shield_range, attrgetter("shieldRange"),
+                                   lambda index, key, stats: self.__shield_amount(index, key) > 0)
+
+    def __init_coverage(self, source=None):
+        cells = self.ARENA_SIZE * self.ARENA_SIZE
+        if source is None:
+            self.__damage_grids = {player_index: array('d', [0.0]) * cells for player_index in (0, 1)}
+            self.__shield_grids = {player_index: array('d', [0.0]) * cells for player_index in (0, 1)}
+            self.__shield_sources = {player_index: [()] * cells for player_index in (0, 1)}
+            self.__threat_sources = {player_index: [()] * cells for player_index in (0, 1)}
+        else:
+            self.__damage_grids = {player_index: array('d', grid) for player_index, grid in source.__damage_grids.items()}
+            self.__shield_grids = {player_index: array('d', grid) for player_index, grid in source.__shield_grids.items()}
+            self.__shield_sources = {player_index: list(sources) for player_index, sources in source.__shield_sources.items()}
+            self.__threat_sources = {player_index: list(sources) for player_index, sources in source.__threat_sources.items()}
+        self.__damage_views = {player_index: memoryview(grid).toreadonly() for player_index, grid in self.__damage_grids.items()}
+        self.__shield_views = {player_index: memoryview(grid).toreadonly() for player_index, grid in self.__shield_grids.items()}
+
+    def get_damage_grid(self, player_index):
+        """Gets the damage per frame a player's stationary units deal to information units at each location.
+
+        The grid includes upgraded ranges and damage and is kept up to date as structures are added, removed and upgraded.
+
+        Args:
+            player_index: The player controlling the stationary units, 0 for you 1 for the enemy
+
+        Returns:
+            A read-only flat view indexed by cell_index([x, y])
+
+        """
+        if player_index not in self.__damage_views:
+            self.warn("Invalid player index {} passed, player index should always be 0 (yourself) or 1 (your opponent)".format(player_index))
+            return
+        return self.__damage_views[player_index]
+
+    def damage_at(self, location, player_index):
+        """Gets the damage per frame a player's stationary units deal to an information unit at a location, see get_damage_grid.
+
+        Locations between cells are answered by scanning the structures around them.
+
+        Returns:
+            The total damage per frame as a float, 0 for locations off the board
+
+        """
+        if player_index not in self.__damage_grids:
+            self.warn("Invalid player index {} passed, player index should always be 0 (yourself) or 1 (your opponent)".format(player_index))
+            return 0.0
+        if not self.in_arena_bounds(location):
+            self._invalid_coordinates(location)
+            return 0.0
+        index = self.__whole_cell_index(location)
+        if index is None:
+            return float(sum(self.__unit_stats(self._type_plane[source], self._upgraded_plane[source]).damage_i
+                             for source in self.__scan_attackers(location, player_index)))
+        return self.__damage_grids[player_index][index]
+
+    def get_threats(self, location, player_index):
+        """Gets a player's stationary units that can attack a location.
+
+        Every location keeps the list of structures in attack range of it, updated as structures
+        are added, removed and upgraded, so this is a single lookup. Locations between cells scan the structures around them.
+
+        Args:
+            location: The location of a hypothetical target
+            player_index: The player controlling the attacking stationary units, 0 for you 1 for the enemy
+
+        Returns:
+            A list of GameUnits, ordered by x then y
+
+        """
+        if player_index not in self.__threat_sources:
+            self.warn("Invalid player index {} passed, player index should always be 0 (yourself) or 1 (your opponent)".format(player_index))
+            return []
+        if not self.in_arena_bounds(location):
+            self._invalid_coordinates(location)
+            return []
+        size = self.ARENA_SIZE
+        index = self.__whole_cell_index(location)
+        sources = self.__scan_attackers(location, player_index) if index is None else self.__threat_sources[player_index][index]
+        return [self.__get_structure((source // size, source % size)) for source in sources]
+
+    def get_shield_grid(self, player_index):
+        """Gets the total shield a player's information units can gain from encryptors at each location.
+
+        Each entry is the sum of the shield of every encryptor in range of the location, including upgrades
+        and the bonus for encryptors further forward. The grid is kept up to date as the map changes.
+
+        Args:
+            player_index: The player controlling the encryptors and the information units, 0 for you 1 for the enemy
+
+        Returns:
+            A read-only flat view indexed by cell_index([x, y])
+
+        """
+        if player_index not in self.__shield_views:
+            self.warn("Invalid player index {} passed, player index should always be 0 (yourself) or 1 (your opponent)".format(player_index))
+            return
+        return self.__shield_views[player_index]
+
+    def shield_at(self, location, player_index):
+        """Gets the total shield from a player's encryptors in range of a location, see get_shield_grid.
+
+        Locations between cells are answered by scanning the encryptors around them.
+
+        Returns:
+            The total shield as a float, 0 for locations off the board
+
+        """
+        if player_index not in self.__shield_grids:
+            self.warn("Invalid player index {} passed, player index should always be 0 (yourself) or 1 (your opponent)".format(player_index))
+            return 0.0
+        if not self.in_arena_bounds(location):
+            self._invalid_coordinates(location)
+            return 0.0
+        index = self.__whole_cell_index(location)
+        if index is None:
+            return float(sum(self.__shield_amount(source, (player_index, self._type_plane[source], bool(self._upgraded_plane[source])))
+                             for source in self.__scan_encryptors(location, player_index)))
+        return self.__shield_grids[player_index][index]
+
+    def path_shield(self, path, player_index):
+        """Gets the shield an information unit gains while following a path.
+
+        Each encryptor shields a unit once, so encryptors in range of several locations of the path are only counted once.
+
+        Args:
+            path: A list of locations, for example from GameState.find_path_to_edge
+            player_index: The player controlling the unit and the encryptors, 0 for you 1 for the enemy
+
+        Returns:
+            The total shield gained along the path
+
+        """
+        if player_index not in self.__shield_sources:
+            self.warn("Invalid player index {} passed, player index should always be 0 (yourself) or 1 (your opponent)".format(player_index))
+            return 0.0
+        sources = self.__shield_sources[player_index]
+        encryptors = set()
+        for location in path:
+            if not self.in_arena_bounds(location):
+                self._invalid_coordinates(location)
+                continue
+            index = self.__whole_cell_index(location)
+            encryptors.update(self.__scan_encryptors(location, player_index) if index is None else sources[index])
+        return sum(self.__shield_amount(index, (player_index, self._type_plane[index], bool(self._upgraded_plane[index])))
+                   for index in encryptors)
+
+    def path_damage(self, path, player_index):
+        """Sums the damage per frame a player's stationary units deal along a path, see get_damage_grid.
+
+        Args:
+            path: A list of locations, for example from GameState.find_path_to_edge
+            player_index: The player controlling the stationary units, 0 for you 1 for the enemy
+
+        Returns:
+            The sum of the damage per frame at every location of the path
+
+        """
+        if player_index not in self.__damage_grids:
+            self.warn("Invalid player index {} passed, player index should always be 0 (yourself) or 1 (your opponent)".format(player_index))
+            return 0.0
+        grid = self.__damage_grids[player_index]
+        total = 0.0
+        for location in path:
+            index = self.__whole_cell_index(location) if self.in_arena_bounds(location) else None
+            total += self.damage_at(location, player_index) if index is None else grid[index]
+        return total
+
+    def __structure_hash(self, index, state):
+        player_index, type_index, upgraded, pending_removal, health = state
+        return _zobrist_key(index, 1, player_index, type_index, upgraded, pending_removal, hash(health) & _MASK_64)
+
+    def __mobile_hash(self, index, units):
+        """XOR of one key per information unit in a cell. The n-th unit of a kind gets its own key so stacks hash by count
+        """
+        mobile_hash = 0
+        counts = {}
+        for unit in units:
+            if not unit.stationary:
+                kind = (unit.player_index, self.__type_index[unit.unit_type])
+                counts[kind] = counts.get(kind, 0) + 1
+                mobile_hash ^= _zobrist_key(index, 2, kind[0], kind[1], counts[kind])
+        return mobile_hash
+
+    def board_hash(self):
+        """Gets a 64 bit hash of every unit on the map, kept up to date incrementally as the map changes.
+
+        It covers the type, owner, upgrade state, pending removal flag and health of stationary units, and the number
+        of each kind of information unit at every location. Equal boards always have equal hashes, including across
+        turns and forks, which makes it useful as a key for caching evaluations.
+
+        Returns:
+            A 64 bit integer
+
+        """
+        return self.__board_hash
+
+    def structure_version(self):
+        """Gets a counter that changes every time a stationary unit is added, removed or modified.
+
+        Useful for invalidating data computed from the stationary units.
+
+        Returns:
+            An integer
+        """
+        return self.__structure_version
+
+    def placement_version(self):
+        """Gets a counter that changes every time a stationary unit is added or removed, or a location changes owner or unit type.
+
+        Unlike structure_version it ignores health, upgrades and removal flags, so it suits data that only depends
+        on which units are where, such as GameState's region tables.
+
+        Returns:
+            An integer
+        """
+        return self.__placement_version
+
+    def blocking_hash(self):
+        """Gets a 64 bit hash of which locations hold a stationary unit.
+
+        Pathing only depends on these locations, so this is a good key for caching paths.
+
+        Returns:
+            A 64 bit integer
+
+        """
+        return self.__blocking_hash
+
+    def __get_structure(self, location):
+        x, y = location
+        for unit in self.__cells[x * self.ARENA_SIZE + y]:
+            if unit.stationary:
+                return unit
+        return None
 
     def _invalid_coordinates(self, location):
         self.warn("{} is out of bounds.".format(str(location)))
@@ -81,6 +775,8 @@ class GameMap:
     def in_arena_bounds(self, location):
         """Checks if the given location is inside the diamond shaped game board.
 
+        Integer locations are answered from a mask precomputed once per arena size.
+
         Args:
             location: A map location
 
@@ -89,19 +785,30 @@ class GameMap:
         
         """
         x, y = location
-        half_board = self.HALF_ARENA
+        try:
+            return x >= 0 and y >= 0 and self.__arena_mask[x][y]
+        except IndexError:
+            return False
+        except TypeError:
+            return _in_diamond(x, y, self.ARENA_SIZE)
 
-        row_size = y + 1
-        startx = half_board - row_size
-        endx = startx + (2 * row_size) - 1
-        top_half_check = (y < self.HALF_ARENA and x >= startx and x <= endx)
+    def in_arena_bounds_batch(self, locations):
+        """Checks many locations at once, see in_arena_bounds.
+
+        Args:
+            locations: A list of map locations
 
-        row_size = (self.ARENA_SIZE - 1 - y) + 1
-        startx = half_board - row_size
-        endx = startx + (2 * row_size) - 1
-        bottom_half_check = (y >= self.HALF_ARENA and x >= startx and x <= endx)
+        Returns:
+            A list of booleans, True for each location that is on the board
 
-        return bottom_half_check or top_half_check
+        """
+        mask = self.__arena_mask
+        size = self.ARENA_SIZE
+        try:
+            return [0 <= x < size and 0 <= y < size and mask[x][y] for x, y in locations]
+        except TypeError:
+            in_arena_bounds = self.in_arena_bounds
+            return [in_arena_bounds(location) for location in locations]
 
     def get_edge_locations(self, quadrant_description):
         """Takes in an edge description and returns a list of locations.
@@ -117,45 +824,220 @@ class GameMap:
             self.warn("Passed invalid quadrant_description '{}'. See the documentation for valid inputs for get_edge_locations.".format(quadrant_description))
             return
 
-        edges = self.get_edges()
-        return edges[quadrant_description]
+        return [list(location) for location in self.__geometry.edges[quadrant_description]]
 
     def get_edges(self):
         """Gets all of the edges and their edge locations
 
+        The edges are computed once per arena size. Each call returns fresh lists, so callers may modify them.
+
         Returns:
             A list with four lists inside of it of locations corresponding to the four edges.
             [0] = top_right, [1] = top_left, [2] = bottom_left, [3] = bottom_right.
         """
-        top_right = []
-        for num in range(0, self.HALF_ARENA):
-            x = self.HALF_ARENA + num
-            y = self.ARENA_SIZE - 1 - num
-            top_right.append([int(x), int(y)])
-        top_left = []
-        for num in range(0, self.HALF_ARENA):
-            x = self.HALF_ARENA - 1 - num
-            y = self.ARENA_SIZE - 1 - num
-            top_left.append([int(x), int(y)])
-        bottom_left = []
-        for num in range(0, self.HALF_ARENA):
-            x = self.HALF_ARENA - 1 - num
-            y = num
-            bottom_left.append([int(x), int(y)])
-        bottom_right = []
-        for num in range(0, self.HALF_ARENA):
-            x = self.HALF_ARENA + num
-            y = num
-            bottom_right.append([int(x), int(y)])
-        return [top_right, top_left, bottom_left, bottom_right]
-    
-    def add_unit(self, unit_type, location, player_index=0):
+        return [[list(location) for location in edge] for edge in self.__geometry.edges]
+
+    def is_on_edge(self, location, quadrant_description):
+        """Checks if a location is on the given edge.
+
+        Args:
+            location: A map location
+            quadrant_description: A constant corresponding to one of the 4 edges. See game_map.TOP_LEFT, game_map.BOTTOM_RIGHT, and similar constants.
+
+        Returns:
+            True if the location is on the edge, False otherwise
+
+        """
+        if not quadrant_description in [self.TOP_LEFT, self.TOP_RIGHT, self.BOTTOM_LEFT, self.BOTTOM_RIGHT]:
+            self.warn("Passed invalid quadrant_description '{}'. See the documentation for valid inputs for is_on_edge.".format(quadrant_description))
+            return False
+        x, y = location
+        return (x, y) in self.__geometry.edge_sets[quadrant_description]
+
+    def is_friendly_spawn_edge(self, location):
+        """Checks if a location is on one of the edges you can deploy information units on.
+
+        Args:
+            location: A map location
+
+        Returns:
+            True if the location is on the bottom left or bottom right edge, False otherwise
+
+        """
+        x, y = location
+        return (x, y) in self.__geometry.friendly_spawn_edge
+
+    def cell_index(self, location):
+        """Gets the index of a location in the flat structure planes.
+
+        Args:
+            location: A map location
+
+        Returns:
+            x * ARENA_SIZE + y, the position of the location in each plane returned by get_structure_planes
+
+        """
+        x, y = location
+        return int(x) * self.ARENA_SIZE + int(y)
+
+    def get_structure_planes(self):
+        """Gets read-only views of the per-cell structure data.
+
+        Each plane is a flat array of ARENA_SIZE * ARENA_SIZE entries indexed by cell_index([x, y]).
+        Cells without a stationary unit hold -1 in 'owner' and 'unit_type' and 0 everywhere else.
+        The views are live, so they always reflect the current map.
+
+        Returns:
+            A dict of memoryviews with keys 'owner' (player index), 'unit_type' (index into config["unitInformation"]),
+            'health', 'upgraded' and 'pending_removal'
+
+        """
+        return self.__structure_planes
+
+    def __indexed_structures(self, player_index, unit_type, upgraded):
+        """Gets the sets of cell indexes holding matching structures from the structure index
+        """
+        type_index = None if unit_type is None else self.__type_index.get(unit_type)
+        if unit_type is not None and type_index is None:
+            self.warn("Invalid unit {}".format(unit_type))
+            return []
+        return [indexes for key, indexes in self.__structure_index.items()
+                if key[0] == player_index and (type_index is None or key[1] == type_index) and (upgraded is None or key[2] == upgraded)]
+
+    def structure_locations(self, player_index, unit_type=None, upgraded=None):
+        """Gets the locations of a player's stationary units from an index kept up to date by the map.
+
+        Args:
+            player_index: The index corresponding to the player controlling the units, 0 for you 1 for the enemy
+            unit_type: If not None, only include units of this type
+            upgraded: If not None, only include units whose upgraded flag matches
+
+        Returns:
+            A list of [x, y] locations in the same order as iterating over the map
+
+        """
+        size = self.ARENA_SIZE
+        indexes = [index for matching in self.__indexed_structures(player_index, unit_type, upgraded) for index in matching]
+        indexes.sort(key=self.__geometry.rank.__getitem__)
+        return [[index // size, index % size] for index in indexes]
+
+    def units_of(self, player_index, unit_type=None, upgraded=None):
+        """Gets a player's stationary units, see structure_locations.
+
+        Returns:
+            A list of GameUnits in the same order as iterating over the map
+
+        """
+        return [self.__get_structure(location) for location in self.structure_locations(player_index, unit_type, upgraded)]
+
+    def count_units(self, player_index, unit_type=None, upgraded=None):
+        """Counts a player's stationary units without scanning the board, see structure_locations.
+
+        Returns:
+            The number of matching stationary units
+
+        """
+        return sum(len(matching) for matching in self.__indexed_structures(player_index, unit_type, upgraded))
+
+    def location_bits(self, locations):
+        """Builds a bitboard from a list of locations.
+
+        A bitboard is a Python int with one bit per on-board location, numbered in the order the map is iterated.
+        Regions, structures and corridors can then be combined with &, | and ~ instead of looping over locations.
+
+        Args:
+            locations: A list of map locations. Off-board locations are ignored
+
+        Returns:
+            The bitboard as an int
+
+        """
+        return self.__geometry.location_bits(locations)
+
+    def bits_to_locations(self, bits):
+        """Lists the locations set in a bitboard, see location_bits.
+
+        Returns:
+            A list of [x, y] locations in the same order as iterating over the map
+
+        """
+        locations = self.__geometry.locations
+        result = []
+        while bits:
+            low_bit = bits & -bits
+            x, y = locations[low_bit.bit_length() - 1]
+            result.append([x, y])
+            bits ^= low_bit
+        return result
+
+    def get_region_bits(self, region):
+        """Gets the precomputed bitboard of a region of the map.
+
+        Args:
+            region: One of 'bottom_half', 'top_half', 'left_half', 'right_half', 'left_corner' (x <= 4), 'right_corner' (x >= 23),
+                'top_right_edge', 'top_left_edge', 'bottom_left_edge' or 'bottom_right_edge'
+
+        Returns:
+            The bitboard as an int, or None for an unknown region
+
+        """
+        if region not in self.__geometry.region_bits:
+            self.warn("Invalid region '{}'. See the documentation for valid inputs for get_region_bits.".format(region))
+            return
+        return self.__geometry.region_bits[region]
+
+    def structure_bits(self, player_index=None, unit_type=None):
+        """Gets a bitboard of the locations holding stationary units, kept up to date as the map changes.
+
+        Args:
+            player_index: If not None, only include units controlled by this player
+            unit_type: If not None, only include units of this type
+
+        Returns:
+            The bitboard as an int, see location_bits
+
+        """
+        type_index = None if unit_type is None else self.__type_index.get(unit_type)
+        bits = 0
+        for (owner, unit_type_index), unit_bits in self.__structure_bits.items():
+            if (player_index is None or owner == player_index) and (unit_type is None or unit_type_index == type_index):
+                bits |= unit_bits
+        return bits
+
+    def count_structures_in(self, region_bits, player_index=None, unit_type=None):
+        """Counts the stationary units inside a region.
+
+        Args:
+            region_bits: A bitboard from get_region_bits or location_bits
+            player_index: If not None, only count units controlled by this player
+            unit_type: If not None, only count units of this type
+
+        Returns:
+            The number of matching stationary units in the region
+
+        """
+        return bin(region_bits & self.structure_bits(player_index, unit_type)).count("1")
+
+    def is_region_blocked(self, region_bits):
+        """Checks if any location in a region holds a stationary unit.
+
+        Args:
+            region_bits: A bitboard from get_region_bits or location_bits
+
+        Returns:
+            True if any location in the region is blocked
+
+        """
+        return region_bits & self.structure_bits() != 0
+
+    def add_unit(self, unit_type, location, player_index=0, health=None):
         """Add a single GameUnit to the map at the given location.
 
         Args:
             unit_type: The type of the new unit. Use the constants provided in algo_strategy.
             location: A list of two integers representing the [x,y] coordinate of the new unit
             player_index: The index corresponding to the player controlling the new unit, 0 for you 1 for the enemy
+            health: The health of the new unit. Uses the starting health of unit_type if None
 
         This function does not affect your turn and only changes the data stored in GameMap. The intended use of this function
         is to allow you to create arbitrary gamestates. Using this function on the game_map provided with game_state will 
@@ -163,15 +1045,18 @@ class GameMap:
         """
         if not self.in_arena_bounds(location):
             self._invalid_coordinates(location)
+            return
         if player_index < 0 or player_index > 1:
             self.warn("Player index {} is invalid. Player index should be 0 or 1.".format(player_index))
 
         x, y = location
-        new_unit = GameUnit(unit_type, self.config, player_index, None, location[0], location[1])
+        new_unit = GameUnit(unit_type, self.config, player_index, health, location[0], location[1])
+        if self.__copy_on_write:
+            self.__owned_units.add(new_unit)
         if not new_unit.stationary:
-            self.__map[x][y].append(new_unit)
+            self.__write_cell(x, y, self.__cells[x * self.ARENA_SIZE + y] + [new_unit])
         else:
-            self.__map[x][y] = [new_unit]
+            self.__write_cell(x, y, [new_unit])
 
     def remove_unit(self, location):
         """Remove all units on the map in the given location.
@@ -184,9 +1069,46 @@ class GameMap:
         """
         if not self.in_arena_bounds(location):
             self._invalid_coordinates(location)
-        
+            return
+
         x, y = location
-        self.__map[x][y] = []
+        self.__write_cell(x, y, [])
+
+    def upgrade(self, location):
+        """Upgrade the stationary unit at the given location.
+
+        Args:
+            location: The location of the unit to upgrade
+
+        Like add_unit, this only changes the data stored in GameMap. Use GameState.attempt_upgrade to upgrade units during your turn.
+        """
+        if not self.in_arena_bounds(location):
+            self._invalid_coordinates(location)
+            return
+        unit = self.__writable_structure(location)
+        if unit is None:
+            self.warn("No stationary unit to upgrade at {}.".format(location))
+            return
+        unit.upgrade()
+        self.__sync_cell(location[0], location[1])
+
+    def set_pending_removal(self, location, pending_removal=True):
+        """Flag the stationary unit at the given location as pending removal.
+
+        Args:
+            location: The location of the unit
+            pending_removal: The new value of the unit's pending_removal flag
+
+        """
+        if not self.in_arena_bounds(location):
+            self._invalid_coordinates(location)
+            return
+        unit = self.__writable_structure(location)
+        if unit is None:
+            self.warn("No stationary unit to flag for removal at {}.".format(location))
+            return
+        unit.pending_removal = pending_removal
+        self.__sync_cell(location[0], location[1])
 
     def get_locations_in_range(self, location, radius):
         """Gets locations in a circular area around a location
@@ -201,21 +1123,39 @@ class GameMap:
         """
         if radius < 0 or radius > self.ARENA_SIZE:
             self.warn("Radius {} was passed to get_locations_in_range. Expected integer between 0 and {}".format(radius, self.ARENA_SIZE))
-        if not self.in_arena_bounds(location):
+        in_bounds = self.in_arena_bounds(location)
+        if not in_bounds:
             self._invalid_coordinates(location)
 
+        hit_radius = self.__get_hit_radius()
         x, y = location
+        if in_bounds and type(x) == int and type(y) == int:
+            in_range = self.__geometry.range_stencil(radius, hit_radius)[x * self.ARENA_SIZE + y]
+            return [[i, j] for i, j in in_range]
+
         locations = []
         search_radius = math.ceil(radius)
-        getHitRadius = self.config["unitInformation"][0]['getHitRadius']
         for i in range(int(x - search_radius), int(x + search_radius + 1)):
             for j in range(int(y - search_radius), int(y + search_radius + 1)):
                 new_location = [i, j]
                 # A unit with a given range affects all locations who's centers are within that range + get hit radius
-                if self.in_arena_bounds(new_location) and self.distance_between_locations(location, new_location) < radius + getHitRadius:
+                if self.in_arena_bounds(new_location) and self.distance_between_locations(location, new_location) < radius + hit_radius:
                     locations.append(new_location)
         return locations
 
+    def get_locations_in_range_batch(self, locations, radius):
+        """Gets the locations in range of many centers at once, see get_locations_in_range
+
+        Args:
+            locations: A list of centers
+            radius: The radius of our search area
+
+        Returns:
+            A list with one list of in range locations per center
+
+        """
+        return [self.get_locations_in_range(location, radius) for location in locations]
+
     def distance_between_locations(self, location_1, location_2):
         """Euclidean distance
 
@@ -232,6 +1172,120 @@ class GameMap:
 
         return math.sqrt((x1 - x2)**2 + (y1 - y2)**2)
 
+    def cell_id(self, location):
+        """Gets the compact id of an on-board location, its position when iterating over the map.
+
+        Args:
+            location: A map location
+
+        Returns:
+            An integer between 0 and the number of on-board locations, or None if the location is not on the board
+            or is between cells
+
+        """
+        if not self.in_arena_bounds(location):
+            return None
+        index = self.__whole_cell_index(location)
+        return None if index is None else self.__geometry.rank[index]
+
+    def get_cell_ids(self):
+        """Gets the cell id of every location at once, see cell_id.
+
+        Returns:
+            A tuple indexed by cell_index([x, y]), holding None for locations off the board
+
+        """
+        return self.__geometry.rank
+
+    def get_distance_row(self, location):
+        """Gets the distances from a location to every on-board location, one row of the distance table.
+
+        Args:
+            location: An on-board location
+
+        Returns:
+            A read-only float64 view indexed by cell id, see get_cell_ids.
+            None if the location is off the board or between cells.
+
+        """
+        cell_id = self.cell_id(location)
+        if cell_id is None:
+            return None
+        count = len(self.__geometry.locations)
+        return self.__geometry.distance_view()[cell_id * count:(cell_id + 1) * count]
+
+    def get_distance_table(self):
+        """Gets the precomputed distances between every pair of on-board locations.
+
+        The table is built once per arena size on first use and shared between maps.
+
+        Returns:
+            A read-only flat float64 view. The distance between cell ids a and b is at a * N + b,
+            where N is the number of on-board locations, see cell_id
+
+        """
+        return self.__geometry.distance_view()
+
+    def cell_distance(self, cell_id_1, cell_id_2):
+        """Looks up the distance between two cell ids in the distance table, see cell_id.
+
+        Returns:
+            The euclidean distance, equal to distance_between_locations
+
+        """
+        return self.__geometry.distance_table()[cell_id_1 * len(self.__geometry.locations) + cell_id_2]
+
+    def lookup_distance(self, location_1, location_2):
+        """Euclidean distance read from the distance table.
+
+        Falls back to distance_between_locations when either location is off the board or between cells.
+        Distances are exactly the values distance_between_locations returns.
+
+        Args:
+            location_1: An arbitrary location, [x, y]
+            location_2: An arbitrary location, [x, y]
+
+        Returns:
+            The euclidean distance between the two locations
+
+        """
+        cell_id_1 = self.cell_id(location_1)
+        cell_id_2 = self.cell_id(location_2)
+        if cell_id_1 is None or cell_id_2 is None:
+            return self.distance_between_locations(location_1, location_2)
+        return self.cell_distance(cell_id_1, cell_id_2)
+
+    def is_within_distance(self, location_1, location_2, max_distance):
+        """Checks if two locations are at most max_distance apart, using the distance table.
+
+        Returns:
+            True if the distance between the locations is at most max_distance
+
+        """
+        return self.lookup_distance(location_1, location_2) <= max_distance
+
+    def locations_within_distance(self, location, max_distance):
+        """Gets every on-board location at most max_distance away from an on-board location, using one row of the distance table.
+
+        Args:
+            location: The center location
+            max_distance: The largest distance to include
+
+        Returns:
+            A list of [x, y] locations in the same order as iterating over the map
+
+        """
+        if not self.in_arena_bounds(location):
+            self._invalid_coordinates(location)
+            return []
+        locations = self.__geometry.locations
+        cell_id = self.cell_id(location)
+        if cell_id is None:
+            return [list(other) for other in locations if self.distance_between_locations(location, other) <= max_distance]
+        count = len(locations)
+        row = self.__geometry.distance_table()[cell_id * count:(cell_id + 1) * count]
+        return [list(locations[other]) for other, distance in enumerate(row) if distance <= max_distance]
+
     def warn(self, message):
         """
         Used internally by game_map to print out default messaging
@@ -2,10 +2,27 @@ import math
 import json
 import sys
 
-from .navigation import ShortestPathFinder
+from .navigation import ShortestPathFinder, PathCache
 from .util import send_command, debug_write
 from .unit import GameUnit
 from .game_map import GameMap
+from .catalog import get_catalog
+
+CATALOG = None
+PATH_CACHE = PathCache()
+
+def _bind_catalog(catalog):
+    """
+    Binds the module level unit type constants to a newly compiled catalog.
+    """
+    global CATALOG, FILTER, ENCRYPTOR, DESTRUCTOR, PING, EMP, SCRAMBLER, REMOVE, UPGRADE, FIREWALL_TYPES, ALL_UNITS, UNIT_TYPE_TO_INDEX
+    CATALOG = catalog
+    FILTER, ENCRYPTOR, DESTRUCTOR = catalog.FILTER, catalog.ENCRYPTOR, catalog.DESTRUCTOR
+    PING, EMP, SCRAMBLER = catalog.PING, catalog.EMP, catalog.SCRAMBLER
+    REMOVE, UPGRADE = catalog.REMOVE, catalog.UPGRADE
+    UNIT_TYPE_TO_INDEX = dict(catalog.type_index)
+    ALL_UNITS = list(catalog.all_units)
+    FIREWALL_TYPES = list(catalog.firewall_types)
 
 def is_stationary(unit_type):
     """
@@ -22,6 +39,7 @@ class GameState:
     Provides methods related to resources and unit deployment
 
     Attributes :
+        * catalog (:obj: UnitCatalog): The unit information compiled from the config, see catalog.py
         * UNIT_TYPE_TO_INDEX (dict): Maps a unit to a corresponding index
         * FILTER (str): A constant representing the filter unit
         * ENCRYPTOR (str): A constant representing the encryptor unit
@@ -39,6 +57,7 @@ class GameState:
         * CORES (int): A constant representing the cores resource, used in the get_resource function
          
         * game_map (:obj: GameMap): The current GameMap. To retrieve a list of GameUnits at a location, use game_map[x, y]
+        * path_cache (:obj: PathCache): The paths found by find_path_to_edge, shared by every GameState so they carry over between turns
         * turn_number (int): The current turn number. Starts at 0.
         * my_health (int): Your current remaining health
         * my_time (int): The time you took to submit your previous turn
@@ -59,27 +78,9 @@ class GameState:
         self.config = config
         self.enable_warnings = True
 
-        global FILTER, ENCRYPTOR, DESTRUCTOR, PING, EMP, SCRAMBLER, REMOVE, UPGRADE, FIREWALL_TYPES, ALL_UNITS, UNIT_TYPE_TO_INDEX
-        UNIT_TYPE_TO_INDEX = {}
-        FILTER = config["unitInformation"][0]["shorthand"]
-        UNIT_TYPE_TO_INDEX[FILTER] = 0
-        ENCRYPTOR = config["unitInformation"][1]["shorthand"]
-        UNIT_TYPE_TO_INDEX[ENCRYPTOR] = 1
-        DESTRUCTOR = config["unitInformation"][2]["shorthand"]
-        UNIT_TYPE_TO_INDEX[DESTRUCTOR] = 2
-        PING = config["unitInformation"][3]["shorthand"]
-        UNIT_TYPE_TO_INDEX[PING] = 3
-        EMP = config["unitInformation"][4]["shorthand"]
-        UNIT_TYPE_TO_INDEX[EMP] = 4
-        SCRAMBLER = config["unitInformation"][5]["shorthand"]
-        UNIT_TYPE_TO_INDEX[SCRAMBLER] = 5
-        REMOVE = config["unitInformation"][6]["shorthand"]
-        UNIT_TYPE_TO_INDEX[REMOVE] = 6
-        UPGRADE = config["unitInformation"][7]["shorthand"]
-        UNIT_TYPE_TO_INDEX[UPGRADE] = 7
-
-        ALL_UNITS = [PING, EMP, SCRAMBLER, FILTER, ENCRYPTOR, DESTRUCTOR]
-        FIREWALL_TYPES = [FILTER, ENCRYPTOR, DESTRUCTOR]
+        self.catalog = get_catalog(config)
+        if self.catalog is not CATALOG:
+            _bind_catalog(self.catalog)
 
         self.ARENA_SIZE = 28
         self.HALF_ARENA = int(self.ARENA_SIZE / 2)
@@ -91,11 +92,16 @@ class GameState:
 
         self.game_map = GameMap(self.config)
         self._shortest_path_finder = ShortestPathFinder()
+        self.path_cache = PATH_CACHE
         self._build_stack = []
         self._deploy_stack = []
         self._player_resources = [
                 {'cores': 0, 'bits': 0},  # player 0, which is you
                 {'cores': 0, 'bits': 0}]  # player 1, which is the opponent
+        self.__region_tables = {}
+        self.__region_tables_source = None
+        self.__legal_actions = None
+        self.__legal_actions_source = None
         self.__parse_state(serialized_string)
 
     def __parse_state(self, state_line):
@@ -130,10 +136,10 @@ class GameState:
         """
         Helper function for __parse_state to add units to the map.
         """
-        typedef = self.config.get("unitInformation")
+        shorthands = self.catalog.shorthands
         for i, unit_types in enumerate(units):
             for uinfo in unit_types:
-                unit_type = typedef[i].get("shorthand")
+                unit_type = shorthands[i]
                 sx, sy, shp = uinfo[:3]
                 x, y = map(int, [sx, sy])
                 hp = float(shp)
@@ -141,13 +147,12 @@ class GameState:
                 if unit_type == REMOVE:
                     # Quick fix will deploy engine fix soon
                     if self.contains_stationary_unit([x,y]):
-                        self.game_map[x,y][0].pending_removal = True
+                        self.game_map.set_pending_removal([x,y])
                 elif unit_type == UPGRADE:
                     if self.contains_stationary_unit([x,y]):
-                        self.game_map[x,y][0].upgrade()
+                        self.game_map.upgrade([x,y])
                 else:
-                    unit = GameUnit(unit_type, self.config, player_number, hp, x, y)
-                    self.game_map[x,y].append(unit)
+                    self.game_map.add_unit(unit_type, [x,y], player_number, hp)
 
     def __resource_required(self, unit_type):
         return self.CORES if is_stationary(unit_type) else self.BITS
@@ -238,8 +243,12 @@ class GameState:
             self._invalid_unit(unit_type)
             return
 
-        costs = self.type_cost(unit_type)
-        player_held = self.get_resources()
+        return self.__count_affordable(self.type_cost(unit_type), self.get_resources())
+
+    def __count_affordable(self, costs, player_held):
+        """
+        The number of units with the given [CORES, BITS] costs that the held [CORES, BITS] resources can pay for.
+        """
         if costs[BITS] > 0 and costs[CORES] > 0:
             return min(math.floor(player_held[CORES] / costs[CORES]), math.floor(player_held[BITS] / costs[BITS]))
         elif costs[BITS] > 0:
@@ -293,12 +302,7 @@ class GameState:
             self._invalid_unit(unit_type)
             return
         
-        unit_def = self.config["unitInformation"][UNIT_TYPE_TO_INDEX[unit_type]]
-        cost_base = [unit_def.get('cost1', 0), unit_def.get('cost2', 0)]
-        if upgrade:
-            return [unit_def.get('upgrade', {}).get('cost1', cost_base[CORES]), unit_def.get('upgrade', {}).get('cost2', cost_base[BITS])]
-
-        return cost_base
+        return self.catalog.cost(unit_type, upgrade)
 
 
     def can_spawn(self, unit_type, location, num=1):
@@ -330,7 +334,7 @@ class GameState:
         stationary = is_stationary(unit_type)
         blocked = self.contains_stationary_unit(location) or (stationary and len(self.game_map[location[0],location[1]]) > 0)
         correct_territory = location[1] < self.HALF_ARENA
-        on_edge = location in (self.game_map.get_edge_locations(self.game_map.BOTTOM_LEFT) + self.game_map.get_edge_locations(self.game_map.BOTTOM_RIGHT))
+        on_edge = self.game_map.is_friendly_spawn_edge(location)
 
         if self.enable_warnings:
             fail_reason = ""
@@ -360,6 +364,66 @@ class GameState:
         Returns:
             The number of units successfully spawned
 
+        """
+        return self.attempt_plan([("spawn", unit_type, locations, num)])[0]
+
+    def attempt_remove(self, locations):
+        """Attempts to remove existing friendly firewalls in the given locations.
+
+        Args:
+            locations: A location or list of locations we want to remove firewalls from
+
+        Returns:
+            The number of firewalls successfully flagged for removal
+
+        """
+        return self.attempt_plan([("remove", None, locations)])[0]
+
+    def attempt_upgrade(self, locations):
+        """Attempts to upgrade units in the given locations.
+
+        Args:
+            locations: A single location or list of locations to upgrade units at
+
+        Returns:
+            The number of units successfully upgraded
+
+        """
+        return self.attempt_plan([("upgrade", None, locations)])[0]
+
+    def attempt_plan(self, actions):
+        """Attempts a list of spawn, upgrade and remove actions in order.
+
+        Each action is checked against the map and the resources left by the actions before it,
+        so the build and deploy stacks end up the same as calling attempt_spawn, attempt_upgrade
+        and attempt_remove one after the other, with less work per location.
+
+        Args:
+            actions: A list of (action, unit_type, locations) or (action, unit_type, locations, num) tuples, where action
+                is "spawn", "upgrade" or "remove". unit_type and num are only used by "spawn", num defaults to 1.
+
+        Returns:
+            A list with the result of each action, the number of units spawned, upgraded or flagged for removal
+
+        """
+        results = []
+        for action in actions:
+            kind, unit_type, locations = action[:3]
+            if kind == "spawn":
+                results.append(self.__plan_spawn(unit_type, locations, action[3] if len(action) > 3 else 1))
+            elif kind == "upgrade":
+                results.append(self.__plan_upgrade(locations))
+            elif kind == "remove":
+                results.append(self.__plan_remove(locations))
+            else:
+                self.warn("Invalid action {}. Actions should be 'spawn', 'upgrade' or 'remove'".format(kind))
+                results.append(None)
+        return results
+
+    def __plan_spawn(self, unit_type, locations, num):
+        """
+        Spawns units for attempt_plan. The costs and unit category are looked up once, and can_spawn is only
+        called to explain a failed spawn, so it gives the same warnings.
         """
         if unit_type not in ALL_UNITS:
             self._invalid_unit(unit_type)
@@ -367,36 +431,38 @@ class GameState:
         if num < 1:
             self.warn("Attempted to spawn fewer than one units! ({})".format(num))
             return
-      
+
         if type(locations[0]) == int:
             locations = [locations]
+        game_map = self.game_map
+        owner_plane = game_map.get_structure_planes()["owner"]
+        resources = self._player_resources[0]
+        costs = self.type_cost(unit_type)
+        stationary = is_stationary(unit_type)
+        stack = self._build_stack if stationary else self._deploy_stack
         spawned_units = 0
         for location in locations:
             for i in range(num):
-                if self.can_spawn(unit_type, location, 1):
+                spawnable = False
+                if game_map.in_arena_bounds(location) and location[1] < self.HALF_ARENA:
                     x, y = map(int, location)
-                    costs = self.type_cost(unit_type)
-                    self.__set_resource(CORES, 0 - costs[CORES])
-                    self.__set_resource(BITS, 0 - costs[BITS])
-                    self.game_map.add_unit(unit_type, location, 0)
-                    if is_stationary(unit_type):
-                        self._build_stack.append((unit_type, x, y))
-                    else:
-                        self._deploy_stack.append((unit_type, x, y))
-                    spawned_units += 1
-                else:
+                    blocked = owner_plane[x * self.ARENA_SIZE + y] >= 0 or (stationary and len(game_map[x, y]) > 0)
+                    spawnable = (not blocked and (stationary or game_map.is_friendly_spawn_edge(location)) and
+                                 self.__count_affordable(costs, [resources['cores'], resources['bits']]) >= 1)
+                if not spawnable:
+                    if self.enable_warnings:
+                        self.can_spawn(unit_type, location, 1)
                     break
+                resources['cores'] = resources['cores'] + (0 - costs[CORES])
+                resources['bits'] = resources['bits'] + (0 - costs[BITS])
+                game_map.add_unit(unit_type, location, 0)
+                stack.append((unit_type, x, y))
+                spawned_units += 1
         return spawned_units
 
-    def attempt_remove(self, locations):
-        """Attempts to remove existing friendly firewalls in the given locations.
-
-        Args:
-            locations: A location or list of locations we want to remove firewalls from
-
-        Returns:
-            The number of firewalls successfully flagged for removal
-
+    def __plan_remove(self, locations):
+        """
+        Flags firewalls for removal for attempt_plan.
         """
         if type(locations[0]) == int:
             locations = [locations]
@@ -410,40 +476,70 @@ class GameState:
                 self.warn("Could not remove a unit from {}. Location has no firewall or is enemy territory.".format(location))
         return removed_units
 
-    def attempt_upgrade(self, locations):
-        """Attempts to upgrade units in the given locations.
-
-        Args:
-            locations: A single location or list of locations to upgrade units at
-
-        Returns:
-            The number of units successfully upgraded
-
+    def __plan_upgrade(self, locations):
+        """
+        Upgrades firewalls for attempt_plan.
         """
-
         if type(locations[0]) == int:
             locations = [locations]
-        spawned_units = 0
+        resources = self._player_resources[0]
+        upgraded_units = 0
         for location in locations:
-            if location[1] < self.HALF_ARENA and self.contains_stationary_unit(location):
-                x, y = map(int, location)
-                existing_unit = None
-                for unit in self.game_map[x,y]:
-                    if unit.stationary:
-                        existing_unit = unit
-
-                if not existing_unit.upgraded and self.config["unitInformation"][UNIT_TYPE_TO_INDEX[existing_unit.unit_type]].get("upgrade", None) is not None:
-                    costs = self.type_cost(existing_unit.unit_type, True)
-                    resources = self.get_resources()
-                    if resources[CORES] >= costs[CORES] and resources[BITS] >= costs[BITS]:
-                        self.__set_resource(CORES, 0 - costs[CORES])
-                        self.__set_resource(BITS, 0 - costs[BITS])
-                        existing_unit.upgrade()
+            existing_unit = location[1] < self.HALF_ARENA and self.contains_stationary_unit(location)
+            if existing_unit:
+                if not existing_unit.upgraded and self.catalog.can_upgrade(existing_unit.unit_type):
+                    costs = self.catalog.cost(existing_unit.unit_type, True)
+                    if resources['cores'] >= costs[CORES] and resources['bits'] >= costs[BITS]:
+                        resources['cores'] = resources['cores'] + (0 - costs[CORES])
+                        resources['bits'] = resources['bits'] + (0 - costs[BITS])
+                        x, y = map(int, location)
+                        self.game_map.upgrade([x, y])
                         self._build_stack.append((UPGRADE, x, y))
-                        spawned_units += 1
+                        upgraded_units += 1
             else:
                 self.warn("Could not upgrade a unit from {}. Location has no firewall or is enemy territory.".format(location))
-        return spawned_units
+        return upgraded_units
+
+    def get_legal_actions(self):
+        """Gets every action we can take with our current resources, as bitboards (see GameMap.location_bits).
+
+        The sets are computed together from the map's bitboards, and the result is kept until the map or our resources change.
+        Use game_map.bits_to_locations to list the locations of a bitboard. The returned dict is shared between calls and should not be modified.
+
+        Returns:
+            A dict with keys
+                'build': maps each firewall type to the locations where can_spawn would allow building it
+                'deploy': maps each information type to the edge locations where can_spawn would allow deploying it
+                'upgrade': the locations attempt_upgrade would upgrade
+                'remove': the locations attempt_remove would flag for removal
+
+        """
+        game_map = self.game_map
+        resources = self.get_resources()
+        source = (game_map, game_map.board_hash(), resources[CORES], resources[BITS])
+        if self.__legal_actions_source is not None and self.__legal_actions_source[0] is game_map and self.__legal_actions_source[1:] == source[1:]:
+            return self.__legal_actions
+
+        friendly = game_map.get_region_bits("bottom_half")
+        edges = game_map.get_region_bits("bottom_left_edge") | game_map.get_region_bits("bottom_right_edge")
+        structures = friendly & game_map.structure_bits()
+        occupied = game_map.location_bits(game_map.occupied_locations())
+        legal_actions = {"build": {}, "deploy": {}, "upgrade": 0, "remove": structures}
+        for unit_type in ALL_UNITS:
+            affordable = self.__count_affordable(self.type_cost(unit_type), resources) >= 1
+            if is_stationary(unit_type):
+                legal_actions["build"][unit_type] = friendly & ~occupied if affordable else 0
+            else:
+                legal_actions["deploy"][unit_type] = edges & ~structures if affordable else 0
+        for unit_type in FIREWALL_TYPES:
+            costs = self.catalog.cost(unit_type, True)
+            if self.catalog.can_upgrade(unit_type) and resources[CORES] >= costs[CORES] and resources[BITS] >= costs[BITS]:
+                for player_index in (0, 1):
+                    legal_actions["upgrade"] |= friendly & game_map.location_bits(game_map.structure_locations(player_index, unit_type, upgraded=False))
+
+        self.__legal_actions = legal_actions
+        self.__legal_actions_source = source
+        return legal_actions
 
     def get_target_edge(self, start_location):
         """Gets the target edge given a starting location
@@ -480,6 +576,8 @@ class GameState:
             A list of locations corresponding to the path the unit would take 
             to get from it's starting location to the best available end location
 
+        Paths are looked up in path_cache first, which is keyed on the map's blocking_hash, the start and the target edge.
+
         """
         if self.contains_stationary_unit(start_location):
             self.warn("Attempted to perform pathing from blocked starting location {}".format(start_location))
@@ -488,8 +586,68 @@ class GameState:
         if target_edge is None:
             target_edge = self.get_target_edge(start_location)
 
+        # Starts that are not lists are matched differently against the edge, see ShortestPathFinder._idealness_search
+        key = (self.game_map.blocking_hash(), start_location[0], start_location[1], isinstance(start_location, list), target_edge)
+        steps = self.path_cache.get(key)
+        if steps is None:
+            end_points = self.game_map.get_edge_locations(target_edge)
+            path = self._shortest_path_finder.navigate_multiple_endpoints(start_location, end_points, self)
+            if path is None:
+                return
+            steps = tuple((x, y) for x, y in path[1:])
+            self.path_cache.put(key, steps)
+        return [start_location] + [[x, y] for x, y in steps]
+
+    def paths_from_all(self, start_locations, target_edge=None):
+        """Gets the paths units at many locations would take, see find_path_to_edge.
+
+        Starts heading for the same edge share their pathlength fields, so the edge is searched once
+        instead of once per start. Paths found are also stored in path_cache.
+
+        Args:
+            start_locations: A list of locations of hypothetical units
+            target_edge: The edge the units want to reach. Induced from each start location if None.
+
+        Returns:
+            A list with the path from each start location, None for blocked starting locations
+
+        """
+        paths = [None] * len(start_locations)
+        misses = {}
+        blocking_hash = self.game_map.blocking_hash()
+        for position, start_location in enumerate(start_locations):
+            if self.contains_stationary_unit(start_location):
+                self.warn("Attempted to perform pathing from blocked starting location {}".format(start_location))
+                continue
+            edge = self.get_target_edge(start_location) if target_edge is None else target_edge
+            key = (blocking_hash, start_location[0], start_location[1], isinstance(start_location, list), edge)
+            steps = self.path_cache.get(key)
+            if steps is None:
+                misses.setdefault(edge, []).append((position, key))
+            else:
+                paths[position] = [start_location] + [[x, y] for x, y in steps]
+
+        for edge, entries in misses.items():
+            end_points = self.game_map.get_edge_locations(edge)
+            found = self._shortest_path_finder.navigate_multiple_starts([start_locations[position] for position, key in entries], end_points, self)
+            for (position, key), path in zip(entries, found):
+                if path is not None:
+                    self.path_cache.put(key, tuple((x, y) for x, y in path[1:]))
+                paths[position] = path
+        return paths
+
+    def get_distance_field(self, target_edge):
+        """Gets the number of steps from every location to an edge, which can be updated as walls are tried out
+
+        Args:
+            target_edge: The edge to measure from. game_map.TOP_LEFT, game_map.BOTTOM_RIGHT, etc.
+
+        Returns:
+            A DistanceField of the current map. Its add_wall and remove_wall only change the field, not the map.
+
+        """
         end_points = self.game_map.get_edge_locations(target_edge)
-        return self._shortest_path_finder.navigate_multiple_endpoints(start_location, end_points, self)
+        return self._shortest_path_finder.get_distance_field(end_points, self)
 
     def contains_stationary_unit(self, location):
         """Check if a location is blocked, return firewall unit if it is
@@ -505,11 +663,85 @@ class GameState:
             self.warn('Checked for stationary unit outside of arena bounds')
             return False
         x, y = map(int, location)
+        if self.game_map.get_structure_planes()["owner"][x * self.ARENA_SIZE + y] < 0:
+            return False
         for unit in self.game_map[x,y]:
             if unit.stationary:
                 return unit
         return False
 
+    def __region_table(self, player_index, unit_type):
+        """
+        Gets the summed-area table counting the matching stationary units, rebuilding it if the map has changed.
+        table[(x + 1) * (ARENA_SIZE + 1) + y + 1] is the number of matching units at locations with x' <= x and y' <= y.
+        """
+        source = (self.game_map, self.game_map.placement_version())
+        if self.__region_tables_source is None or self.__region_tables_source[0] is not source[0] or self.__region_tables_source[1] != source[1]:
+            self.__region_tables = {}
+            self.__region_tables_source = source
+
+        key = (player_index, unit_type)
+        table = self.__region_tables.get(key)
+        if table is None:
+            planes = self.game_map.get_structure_planes()
+            owners = planes["owner"]
+            types = planes["unit_type"]
+            type_index = None if unit_type is None else UNIT_TYPE_TO_INDEX[unit_type]
+            stride = self.ARENA_SIZE + 1
+            table = [0] * (stride * stride)
+            for x in range(self.ARENA_SIZE):
+                column_sum = 0
+                for y in range(self.ARENA_SIZE):
+                    index = x * self.ARENA_SIZE + y
+                    if owners[index] >= 0 and (player_index is None or owners[index] == player_index) and (type_index is None or types[index] == type_index):
+                        column_sum += 1
+                    table[(x + 1) * stride + y + 1] = table[x * stride + y + 1] + column_sum
+            self.__region_tables[key] = table
+        return table
+
+    def count_in_region(self, x1, y1, x2, y2, player_index=None, unit_type=None):
+        """Counts the stationary units inside a rectangle of the map.
+
+        The counts come from summed-area tables that are built once and reused until the map changes,
+        so each query takes constant time.
+
+        Args:
+            x1, y1: The lower left corner of the rectangle
+            x2, y2: The upper right corner of the rectangle, inclusive
+            player_index: If not None, only count units controlled by this player
+            unit_type: If not None, only count units of this type
+
+        Returns:
+            The number of matching stationary units in the rectangle
+
+        """
+        if unit_type is not None and unit_type not in FIREWALL_TYPES:
+            self._invalid_unit(unit_type)
+            return 0
+        x1, y1 = max(x1, 0), max(y1, 0)
+        x2, y2 = min(x2, self.ARENA_SIZE - 1), min(y2, self.ARENA_SIZE - 1)
+        if x1 > x2 or y1 > y2:
+            return 0
+        table = self.__region_table(player_index, unit_type)
+        stride = self.ARENA_SIZE + 1
+        return (table[(x2 + 1) * stride + y2 + 1] - table[x1 * stride + y2 + 1]
+                - table[(x2 + 1) * stride + y1] + table[x1 * stride + y1])
+
+    def weighted_region_sum(self, x1, y1, x2, y2, weights, player_index=None):
+        """Sums a weight per stationary unit inside a rectangle of the map, see count_in_region.
+
+        Args:
+            x1, y1: The lower left corner of the rectangle
+            x2, y2: The upper right corner of the rectangle, inclusive
+            weights: A dict from unit type to the weight of each unit of that type. Types that are not in the dict count as 0
+            player_index: If not None, only count units controlled by this player
+
+        Returns:
+            The weighted sum of the stationary units in the rectangle
+
+        """
+        return sum(weight * self.count_in_region(x1, y1, x2, y2, player_index, unit_type) for unit_type, weight in weights.items())
+
     def warn(self, message):
         """ Used internally by game_state to print warnings
         """
@@ -549,6 +781,10 @@ class GameState:
 
         attacker_location = [attacking_unit.x, attacking_unit.y]
         possible_locations = self.game_map.get_locations_in_range(attacker_location, attacking_unit.attackRange)
+        # Distances are read from the attacker's row of the distance table, attackers between cells compute them
+        distance_row = self.game_map.get_distance_row(attacker_location)
+        cell_ids = self.game_map.get_cell_ids()
+        size = self.ARENA_SIZE
         target = None
         target_stationary = True
         target_distance = sys.maxsize
@@ -557,13 +793,19 @@ class GameState:
         target_x_distance = 0
 
         for location in possible_locations:
+            location_distance = None
             for unit in self.game_map[location]:
                 if unit.player_index == attacking_unit.player_index or (attacking_unit.damage_f == 0 and is_stationary(unit.unit_type)) or (attacking_unit.damage_i == 0 and not(is_stationary(unit.unit_type))):
                     continue
 
                 new_target = False
                 unit_stationary = unit.stationary
-                unit_distance = self.game_map.distance_between_locations(location, [attacking_unit.x, attacking_unit.y])
+                if location_distance is None:
+                    if distance_row is None:
+                        location_distance = self.game_map.distance_between_locations(location, attacker_location)
+                    else:
+                        location_distance = distance_row[cell_ids[location[0] * size + location[1]]]
+                unit_distance = location_distance
                 unit_health = unit.health
                 unit_y = unit.y
                 unit_x_distance = abs(self.HALF_ARENA - 0.5 - unit.x)
@@ -607,9 +849,72 @@ class GameState:
                     target_x_distance = unit_x_distance
         return target
 
+    def get_targets(self, attacking_units, candidate_units=None):
+        """Returns the target of every given unit at once, see get_target.
+
+        The candidates are grouped by location and their priority keys are computed once for all attackers,
+        so each attacker only compares the precomputed keys of the candidates in its range.
+
+        Args:
+            attacking_units: A list of GameUnits
+            candidate_units: The GameUnits that can be targeted, every unit on the map if None
+
+        Returns:
+            A list with the GameUnit each attacker would choose to attack, or None if it has no target.
+            With the default candidates, each result is the unit get_target would return.
+
+        """
+        if candidate_units is None:
+            candidate_units = [unit for location in self.game_map for unit in self.game_map[location]]
+
+        # The priority chain of get_target is a lexicographic comparison, ties keep the first unit found
+        # while walking the locations in range by x then y, so the candidates are kept in that order.
+        size = self.ARENA_SIZE
+        center_x = self.HALF_ARENA - 0.5
+        cell_ids = self.game_map.get_cell_ids()
+        candidates = {}
+        for unit in sorted(candidate_units, key=lambda unit: (unit.x, unit.y)):
+            stationary = is_stationary(unit.unit_type)
+            key = (unit.stationary, unit.health, unit.y, -abs(center_x - unit.x))
+            candidates.setdefault(unit.x * size + unit.y, []).append((unit, stationary, key))
+
+        targets = []
+        for attacking_unit in attacking_units:
+            if not isinstance(attacking_unit, GameUnit) or type(attacking_unit.x) != int or type(attacking_unit.y) != int \
+                    or not self.game_map.in_arena_bounds([attacking_unit.x, attacking_unit.y]):
+                targets.append(self.get_target(attacking_unit))
+                continue
+
+            attacker_location = [attacking_unit.x, attacking_unit.y]
+            distance_row = self.game_map.get_distance_row(attacker_location)
+            player_index = attacking_unit.player_index
+            hits_stationary = attacking_unit.damage_f != 0
+            hits_mobile = attacking_unit.damage_i != 0
+            y_sign = 1 if player_index == 0 else -1
+            target = None
+            target_key = None
+            for location in self.game_map.get_locations_in_range(attacker_location, attacking_unit.attackRange):
+                cell = candidates.get(location[0] * size + location[1])
+                if cell is None:
+                    continue
+                distance = None
+                for unit, stationary, (unit_stationary, health, y, x_distance) in cell:
+                    if unit.player_index == player_index or (stationary and not hits_stationary) or (not stationary and not hits_mobile):
+                        continue
+                    if distance is None:
+                        distance = distance_row[cell_ids[location[0] * size + location[1]]]
+                    key = (unit_stationary, distance, health, y_sign * y, x_distance)
+                    if target_key is None or key < target_key:
+                        target = unit
+                        target_key = key
+            targets.append(target)
+        return targets
+
     def get_attackers(self, location, player_index):
         """Gets the stationary units threatening a given location
 
+        This is a lookup in an index of attackers per location that GameMap keeps up to date, see GameMap.get_threats.
+
         Args:
             location: The location of a hypothetical defender
             player_index: The index corresponding to the defending player, 0 for you 1 for the enemy
@@ -621,20 +926,22 @@ class GameState:
 
         if not player_index == 0 and not player_index == 1:
             self._invalid_player_index(player_index)
+            return []
         if not self.game_map.in_arena_bounds(location):
             self.warn("Location {} is not in the arena bounds.".format(location))
+            return []
+
+        return self.game_map.get_threats(location, 1 - player_index)
+
+    def get_attackers_batch(self, locations, player_index):
+        """Gets the stationary units threatening each location of a list, for example a whole path, see get_attackers
+
+        Args:
+            locations: A list of locations of a hypothetical defender
+            player_index: The index corresponding to the defending player, 0 for you 1 for the enemy
+
+        Returns:
+            A list with one list of attacking units per location
 
-        attackers = []
-        """
-        Get locations in the range of DESTRUCTOR units
         """
-        max_range = 0
-        for unit in self.config["unitInformation"]:
-            if unit.get('attackRange', 0) >= max_range:
-                max_range = unit.get('attackRange', 0)
-        possible_locations= self.game_map.get_locations_in_range(location, max_range)
-        for location_unit in possible_locations:
-            for unit in self.game_map[location_unit]:
-                if unit.damage_i + unit.damage_f > 0 and unit.player_index != player_index and self.game_map.distance_between_locations(location, location_unit) >= unit.attackRange:
-                    attackers.append(unit)
-        return attackers
+        return [self.get_attackers(location, player_index) for location in locations]
@@ -1,24 +1,251 @@
 import heapq
 import math
 import sys
-import queue
+from array import array
+from collections import OrderedDict
 from .util import debug_write
 
-class Node:
-    """A pathfinding node
+
+_NEIGHBORS = {}
+
+def _get_neighbor_table(game_map):
+    """Gets the on-board neighbors of every cell, shared between pathfinders.
+
+    Returns:
+        A tuple indexed by x * ARENA_SIZE + y of tuples of neighbor indexes, in the order of
+        ShortestPathFinder._get_neighbors with off-board neighbors left out. Off-board cells have no neighbors.
+    """
+    size = game_map.ARENA_SIZE
+    table = _NEIGHBORS.get(size)
+    if table is None:
+        neighbors = []
+        for x in range(size):
+            for y in range(size):
+                if not game_map.in_arena_bounds([x, y]):
+                    neighbors.append(())
+                    continue
+                neighbors.append(tuple(i * size + j for i, j in ((x, y + 1), (x, y - 1), (x + 1, y), (x - 1, y))
+                                       if game_map.in_arena_bounds([i, j])))
+        table = _NEIGHBORS[size] = tuple(neighbors)
+    return table
+
+class PathCache:
+    """A bounded least recently used cache of paths.
+
+    A path only depends on the locations of the stationary units, the start and the target edge,
+    so paths are stored under keys built from GameMap.blocking_hash(). Any change to the blocking
+    structures changes the key, and the stale paths are evicted as new ones come in.
 
     Attributes :
-        * visited_idealness (bool): Have we visited this node during the idealness search step?
-        * visited_validate (bool): Have we visited this node during the validation step?
-        * blocked (bool): Is there a firewall at this node's location
-        * pathlength: The distance between this node and the target location
+        * maxsize (int): The most paths kept
+        * hits (int): The number of lookups that found a path
+        * misses (int): The number of lookups that did not
 
     """
-    def __init__(self):
-        self.visited_idealness = False
-        self.visited_validate = False
-        self.blocked = False
-        self.pathlength = -1
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.__paths = OrderedDict()
+
+    def __len__(self):
+        return len(self.__paths)
+
+    def get(self, key):
+        """Looks up a path, marking it as recently used
+
+        Returns:
+            The stored path, or None if there is none for this key
+
+        """
+        path = self.__paths.get(key)
+        if path is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.__paths.move_to_end(key)
+        return path
+
+    def put(self, key, path):
+        """Stores a path, evicting the least recently used one if the cache is full
+        """
+        self.__paths[key] = path
+        self.__paths.move_to_end(key)
+        if len(self.__paths) > self.maxsize:
+            self.__paths.popitem(last=False)
+
+    def clear(self):
+        """Empties the cache and resets the hit and miss counters
+        """
+        self.__paths.clear()
+        self.hits = 0
+        self.misses = 0
+
+class DistanceField:
+    """The number of steps from every location to a set of endpoints, kept up to date as walls are added and removed.
+
+    Built by ShortestPathFinder.get_distance_field from the pathlengths of a search started at every endpoint.
+    Adding or removing one wall only searches again the region whose distances change: a removed wall lowers the
+    distances around it, and an added wall raises the distances of the locations that were only reachable through it.
+    Every change is recorded, so undo returns the field to the state before it, which is useful to try many
+    candidate walls against the same base map.
+
+    Distances are -1 for walls and for locations that cannot reach any endpoint.
+
+    """
+    def __init__(self, game_map, neighbors, blocked, distances, end_points):
+        self.game_map = game_map
+        self.__size = game_map.ARENA_SIZE
+        self.__neighbors = neighbors
+        self.__blocked = blocked
+        self.__distances = distances
+        self.__end_indexes = frozenset(location[0] * self.__size + location[1] for location in end_points)
+        self.__journal = []
+
+    def __len__(self):
+        """The number of changes that can be undone"""
+        return len(self.__journal)
+
+    def distance(self, location):
+        """Gets the number of steps from a location to the closest endpoint
+
+        Returns:
+            The distance, -1 for walls, unreachable locations and locations off the board
+
+        """
+        if not self.game_map.in_arena_bounds(location):
+            return -1
+        return self.__distances[location[0] * self.__size + location[1]]
+
+    def add_wall(self, location):
+        """Blocks a location and raises the distances that went through it
+
+        Returns:
+            The number of locations whose distance changed, including the new wall
+
+        """
+        changes = []
+        index = self.__index(location)
+        if index is not None and self.__blocked[index]:
+            index = None
+        if index is not None:
+            self.__blocked[index] = 1
+            distances = self.__distances
+            old_distance = distances[index]
+            changes.append((index, old_distance))
+            distances[index] = -1
+            if old_distance >= 0:
+                self.__raise(self.__find_orphans(index, old_distance), changes)
+        self.__journal.append((index, changes))
+        return len(changes)
+
+    def remove_wall(self, location):
+        """Unblocks a location and lowers the distances that can now go through it
+
+        Returns:
+            The number of locations whose distance changed, including the removed wall
+
+        """
+        changes = []
+        index = self.__index(location)
+        if index is not None and not self.__blocked[index]:
+            index = None
+        if index is not None:
+            self.__blocked[index] = 0
+            distances = self.__distances
+            if index in self.__end_indexes:
+                distance = 0
+            else:
+                reachable = [distances[neighbor] for neighbor in self.__neighbors[index] if distances[neighbor] >= 0]
+                distance = min(reachable) + 1 if reachable else -1
+            if distance >= 0:
+                changes.append((index, distances[index]))
+                distances[index] = distance
+                self.__lower(index, changes)
+        self.__journal.append((index, changes))
+        return len(changes)
+
+    def undo(self):
+        """Reverts the last add_wall or remove_wall
+
+        Changes that did nothing, such as adding a wall where there already is one, are recorded too,
+        so every call can be paired with an undo.
+
+        Returns:
+            False if there was nothing to undo, True otherwise
+
+        """
+        if not self.__journal:
+            return False
+        index, changes = self.__journal.pop()
+        if index is not None:
+            self.__blocked[index] ^= 1
+        distances = self.__distances
+        for changed, distance in reversed(changes):
+            distances[changed] = distance
+        return True
+
+    def __index(self, location):
+        """The index of a location, None if it is off the board"""
+        if not self.game_map.in_arena_bounds(location):
+            return None
+        return location[0] * self.__size + location[1]
+
+    def __find_orphans(self, wall, wall_distance):
+        """Finds the locations left without a neighbor one step closer to an endpoint once a wall is added.
+        Candidates are checked one distance at a time, so their closer neighbors are already settled.
+        """
+        neighbors = self.__neighbors
+        distances = self.__distances
+        candidates = [neighbor for neighbor in neighbors[wall] if distances[neighbor] == wall_distance + 1]
+        queued = set(candidates)
+        orphans = set()
+        for candidate in candidates:
+            distance = distances[candidate]
+            if any(distances[neighbor] == distance - 1 and neighbor not in orphans for neighbor in neighbors[candidate]):
+                continue
+            orphans.add(candidate)
+            for neighbor in neighbors[candidate]:
+                if distances[neighbor] == distance + 1 and neighbor not in queued:
+                    queued.add(neighbor)
+                    candidates.append(neighbor)
+        return orphans
+
+    def __raise(self, orphans, changes):
+        """Gives new distances to the orphans of a wall, searching from their neighbors that kept theirs"""
+        neighbors = self.__neighbors
+        distances = self.__distances
+        for orphan in orphans:
+            changes.append((orphan, distances[orphan]))
+            distances[orphan] = -1
+        heap = []
+        for orphan in orphans:
+            reachable = [distances[neighbor] for neighbor in neighbors[orphan] if distances[neighbor] >= 0]
+            if reachable:
+                heap.append((min(reachable) + 1, orphan))
+        heapq.heapify(heap)
+        while heap:
+            distance, orphan = heapq.heappop(heap)
+            if distances[orphan] >= 0:
+                continue
+            distances[orphan] = distance
+            for neighbor in neighbors[orphan]:
+                if neighbor in orphans and distances[neighbor] < 0:
+                    heapq.heappush(heap, (distance + 1, neighbor))
+
+    def __lower(self, start, changes):
+        """Spreads the distance of a removed wall to the neighbors it brings closer to an endpoint"""
+        neighbors = self.__neighbors
+        blocked = self.__blocked
+        distances = self.__distances
+        current = [start]
+        for current_index in current:
+            next_distance = distances[current_index] + 1
+            for neighbor in neighbors[current_index]:
+                if not blocked[neighbor] and (distances[neighbor] < 0 or distances[neighbor] > next_distance):
+                    changes.append((neighbor, distances[neighbor]))
+                    distances[neighbor] = next_distance
+                    current.append(neighbor)
 
 """
 This class helps with pathfinding. We guarantee the results will
@@ -40,17 +267,60 @@ class ShortestPathFinder:
         self.HORIZONTAL = 1
         self.VERTICAL = 2
         self.initialized = False
+        self._blocked = None
+        self._blocking_hash = None
+        self._generation = 0
 
     def initialize_map(self, game_state):
         """Initializes the map
 
+        The pathfinder keeps its state in flat arrays indexed by x * ARENA_SIZE + y, allocated once and reused by every search:
+        blocked (1 for a firewall), the pathlengths and the visit stamps of both searches. Each search gets a new generation
+        number, and a location counts as visited, or as having a pathlength, only if its stamp holds the current generation,
+        so nothing has to be cleared between searches. The walls are only rebuilt when the map's blocking_hash changes.
+
         Args:
             game_state: A GameState object representing the gamestate we want to traverse
         """
         #Initialize map 
         self.initialized = True
         self.game_state = game_state
-        self.game_map = [[Node() for x in range(self.game_state.ARENA_SIZE)] for y in range(self.game_state.ARENA_SIZE)]
+        self.game_map = game_state.game_map
+        size = game_state.ARENA_SIZE
+        cells = size * size
+        if self._blocked is None or len(self._blocked) != cells:
+            self._neighbors = _get_neighbor_table(self.game_map)
+            self._blocked = bytearray(cells)
+            self._idealness_stamps = array('I', [0]) * cells
+            self._validate_stamps = array('I', [0]) * cells
+            self._pathlength = array('i', [0]) * cells
+            self._blocking_hash = None
+            self._generation = 0
+
+        self._next_generation()
+
+        #Fill in walls
+        blocking_hash = self.game_map.blocking_hash()
+        if blocking_hash != self._blocking_hash:
+            self._blocked[:] = bytes(cells)
+            for x, y in self.game_map.occupied_locations(stationary=True):
+                self._blocked[x * size + y] = 1
+            self._blocking_hash = blocking_hash
+
+    def _next_generation(self):
+        """Starts a new generation, which forgets the visits and pathlengths of the previous searches
+        """
+        self._generation += 1
+        if self._generation > 0xFFFFFFFF:
+            cells = len(self._blocked)
+            self._idealness_stamps = array('I', [0]) * cells
+            self._validate_stamps = array('I', [0]) * cells
+            self._generation = 1
+
+    def _get_pathlength(self, index):
+        """The pathlength of a location index from the last validation, -1 if it was not reached
+        """
+        return self._pathlength[index] if self._validate_stamps[index] == self._generation else -1
 
     def navigate_multiple_endpoints(self, start_point, end_points, game_state):
         """Finds the path a unit would take to reach a set of endpoints
@@ -65,47 +335,157 @@ class ShortestPathFinder:
             Note that this path can change if a tower is destroyed during pathing, or if you or your enemy places firewalls.
 
         """
-        if game_state.contains_stationary_unit(start_point):
+        if game_state.contains_stationary_unit(start_point) or not game_state.game_map.in_arena_bounds(start_point):
             return
 
-        #Initialize map 
+        #Initialize map and walls
         self.initialize_map(game_state)
-        #Fill in walls
-        for location in self.game_state.game_map:
-            if self.game_state.contains_stationary_unit(location):
-                self.game_map[location[0]][location[1]].blocked = True
         #Do pathfinding
         ideal_endpoints = self._idealness_search(start_point, end_points)
         self._validate(ideal_endpoints, end_points)
         return self._get_path(start_point, end_points)
 
+    def navigate_multiple_starts(self, start_points, end_points, game_state):
+        """Finds the paths units at many start points would take to reach the same set of endpoints
+
+        Every start in a pocket of pathable space has the same most ideal tile, so the pockets of the starts are found
+        first and each pathlength field is built once: one from the endpoints, shared by every pocket that reaches them,
+        and one per self destruct pocket. The paths are the same as calling navigate_multiple_endpoints for each start.
+
+        Args:
+            * start_points: The starting locations of the units
+            * end_points: The end points of the units, should be a list of edge locations
+            * game_state: The current game state
+
+        Returns:
+            A list with the path from each start point, or None for blocked or off-board start points
+
+        """
+        paths = [None] * len(start_points)
+        self.initialize_map(game_state)
+        size = game_state.ARENA_SIZE
+        end_indexes = set(location[0] * size + location[1] for location in end_points if isinstance(location, list))
+        direction = self._get_direction_from_endpoints(end_points)
+        pocket_sources = {}
+        starts_by_source = {}
+        for position, start_point in enumerate(start_points):
+            if not game_state.game_map.in_arena_bounds(start_point):
+                continue
+            start_index = start_point[0] * size + start_point[1]
+            if self._blocked[start_index]:
+                continue
+            if start_point in end_points:
+                # Already at an endpoint, matched with == like _get_idealness does. A tuple start only equals tuple endpoints,
+                # tuple starts on a list endpoint are handled by their pocket below
+                paths[position] = [start_point]
+                continue
+            if start_index not in pocket_sources:
+                pocket = self._get_pocket(start_index)
+                source = self._get_pocket_source(pocket, end_indexes, direction)
+                for index in pocket:
+                    pocket_sources[index] = source
+            starts_by_source.setdefault(pocket_sources[start_index], []).append(position)
+
+        for source, positions in starts_by_source.items():
+            self._next_generation()
+            self._validate(None if source is None else list(divmod(source, size)), end_points)
+            for position in positions:
+                paths[position] = self._get_path(start_points[position], end_points)
+        return paths
+
+    def _get_pocket(self, start_index):
+        """Lists the location indexes of the pocket of pathable space around a location, in breadth first order
+        """
+        visited = self._idealness_stamps
+        generation = self._generation
+        blocked = self._blocked
+        neighbors = self._neighbors
+        visited[start_index] = generation
+        pocket = [start_index]
+        for search_index in pocket:
+            for neighbor in neighbors[search_index]:
+                if not blocked[neighbor] and visited[neighbor] != generation:
+                    visited[neighbor] = generation
+                    pocket.append(neighbor)
+        return pocket
+
+    def _get_pocket_source(self, pocket, end_indexes, direction):
+        """The index of the most ideal tile of a pocket, the tile _idealness_search would find from any start in it.
+        None if the pocket reaches an endpoint.
+        """
+        size = self.game_state.ARENA_SIZE
+        x_ideal = 0 if direction[0] == 1 else 27
+        y_ideal = 0 if direction[1] == 1 else 27
+        most_ideal = None
+        best_idealness = -1
+        for index in pocket:
+            if index in end_indexes:
+                return None
+            x, y = divmod(index, size)
+            idealness = 28 * abs(y_ideal - y) + abs(x_ideal - x)
+            if idealness > best_idealness:
+                best_idealness = idealness
+                most_ideal = index
+        return most_ideal
+
+    def get_distance_field(self, end_points, game_state):
+        """Builds a DistanceField from the pathlengths of a search started at every endpoint
+
+        Args:
+            * end_points: The end points of the units, should be a list of edge locations
+            * game_state: The current game state
+
+        Returns:
+            A DistanceField with its own copy of the walls and distances, so later searches do not change it
+
+        """
+        self.initialize_map(game_state)
+        self._next_generation()
+        self._validate(None, end_points)
+        cells = len(self._blocked)
+        distances = array('i', (self._get_pathlength(index) if not self._blocked[index] else -1 for index in range(cells)))
+        return DistanceField(self.game_map, self._neighbors, bytearray(self._blocked), distances, end_points)
+
     def _idealness_search(self, start, end_points):
         """
         Finds the most ideal tile in our 'pocket' of pathable space. 
-        The edge if it is available, or the best self destruct location otherwise
+        The edge if it is available, or the best self destruct location otherwise.
+        Returns the location of the tile, or None if it is one of the end points.
         """
-        current = queue.Queue()
-        current.put(start)
+        size = self.game_state.ARENA_SIZE
+        neighbors = self._neighbors
+        blocked = self._blocked
+        visited = self._idealness_stamps
+        generation = self._generation
+        # Like _get_idealness, a location only matches an end point when both are lists
+        end_indexes = set(location[0] * size + location[1] for location in end_points if isinstance(location, list))
+        direction = self._get_direction_from_endpoints(end_points)
+        x_ideal = 0 if direction[0] == 1 else 27
+        y_ideal = 0 if direction[1] == 1 else 27
+
+        start_index = start[0] * size + start[1]
+        if start_index in end_indexes and (isinstance(start, list) or any(not blocked[neighbor] for neighbor in neighbors[start_index])):
+            # A start that is not a list is still matched when a neighbor looks back at it as [x, y]
+            return None
         best_idealness = self._get_idealness(start, end_points)
-        self.game_map[start[0]][start[1]].visited_idealness = True
         most_ideal = start
-
-        while not current.empty():
-            search_location = current.get()
-            for neighbor in self._get_neighbors(search_location):
-                if not self.game_state.game_map.in_arena_bounds(neighbor) or self.game_map[neighbor[0]][neighbor[1]].blocked:
+        visited[start_index] = generation
+        current = [start_index]
+        # Every location is scored when it is first queued, and only the end points tie,
+        # so the search can stop at the first end point it queues
+        for search_index in current:
+            for neighbor in neighbors[search_index]:
+                if blocked[neighbor] or visited[neighbor] == generation:
                     continue
-
-                x, y = neighbor
-                current_idealness = self._get_idealness(neighbor, end_points)
-
+                if neighbor in end_indexes:
+                    return None
+                x, y = divmod(neighbor, size)
+                current_idealness = 28 * abs(y_ideal - y) + abs(x_ideal - x)
                 if current_idealness > best_idealness:
                     best_idealness = current_idealness
-                    most_ideal = neighbor
-
-                if not self.game_map[x][y].visited_idealness and not self.game_map[x][y].blocked:
-                    self.game_map[x][y].visited_idealness = True
-                    current.put(neighbor)
+                    most_ideal = [x, y]
+                visited[neighbor] = generation
+                current.append(neighbor)
 
         return most_ideal
 
@@ -159,39 +539,37 @@ class ShortestPathFinder:
         return idealness
 
     def _validate(self, ideal_tile, end_points):
-        """Breadth first search of the grid, setting the pathlengths of each node
+        """Breadth first search of the grid, setting the pathlengths of each node.
+        Starts from every end point if ideal_tile is None, from ideal_tile otherwise.
 
         """
         #VALDIATION
         #Add our most ideal tiles to current
-        current = queue.Queue()
-        if ideal_tile in end_points:
-            for location in end_points:
-               current.put(location)
-               #Set current pathlength to 0
-               self.game_map[location[0]][location[1]].pathlength = 0
-               self.game_map[location[0]][location[1]].visited_validate = True
-        else:
-            current.put(ideal_tile)
-            self.game_map[ideal_tile[0]][ideal_tile[1]].pathlength = 0
-            self.game_map[ideal_tile[0]][ideal_tile[1]].visited_validate = True
+        size = self.game_state.ARENA_SIZE
+        neighbors = self._neighbors
+        blocked = self._blocked
+        visited = self._validate_stamps
+        generation = self._generation
+        pathlength = self._pathlength
+        sources = end_points if ideal_tile is None else [ideal_tile]
+        current = []
+        for location in sources:
+            index = location[0] * size + location[1]
+            current.append(index)
+            #Set current pathlength to 0
+            pathlength[index] = 0
+            visited[index] = generation
 
         #While current is not empty
-        while not current.empty():
-            current_location = current.get()
-            current_node = self.game_map[current_location[0]][current_location[1]]
-            for neighbor in self._get_neighbors(current_location):
-                if not self.game_state.game_map.in_arena_bounds(neighbor) or self.game_map[neighbor[0]][neighbor[1]].blocked:
-                    continue
-
-                neighbor_node = self.game_map[neighbor[0]][neighbor[1]]
-                if not neighbor_node.visited_validate and not current_node.blocked:
-                    neighbor_node.pathlength = current_node.pathlength + 1
-                    neighbor_node.visited_validate = True
-                    current.put(neighbor)
-
-        #debug_write("Print after validate")
-        #self.print_map()
+        for current_index in current:
+            if blocked[current_index]:
+                continue
+            next_pathlength = pathlength[current_index] + 1
+            for neighbor in neighbors[current_index]:
+                if not blocked[neighbor] and visited[neighbor] != generation:
+                    pathlength[neighbor] = next_pathlength
+                    visited[neighbor] = generation
+                    current.append(neighbor)
         return
 
     def _get_path(self, start_point, end_points):
@@ -199,57 +577,49 @@ class ShortestPathFinder:
 
         """
         #GET THE PATH
+        size = self.game_state.ARENA_SIZE
         path = [start_point]
-        current = start_point
+        current = start_point[0] * size + start_point[1]
         move_direction = 0
 
-        while not self.game_map[current[0]][current[1]].pathlength == 0:
-            #debug_write("current tile {} has cost {}".format(current, self.game_map[current[0]][current[1]].pathlength))
+        while not self._get_pathlength(current) == 0:
             next_move = self._choose_next_move(current, move_direction, end_points)
-            #debug_write(next_move)
 
-            if current[0] == next_move[0]:
+            if current // size == next_move // size:
                 move_direction = self.VERTICAL
             else:
                 move_direction = self.HORIZONTAL
-            path.append(next_move)
+            path.append(list(divmod(next_move, size)))
             current = next_move
         
-        #debug_write(path)
         return path
   
-    def _choose_next_move(self, current_point, previous_move_direction, end_points):
-        """Given the current location and adjacent locations, return the best 'next step' for a given unit to take
+    def _choose_next_move(self, current_index, previous_move_direction, end_points):
+        """Given the current location and adjacent locations, return the best 'next step' for a given unit to take.
+        Locations are passed and returned as x * ARENA_SIZE + y indexes.
         """
-        neighbors = self._get_neighbors(current_point)
-        #debug_write("Unit at {} previously moved {} and has these neighbors {}".format(current_point, previous_move_direction, neighbors))
-
-        ideal_neighbor = current_point
-        best_pathlength = self.game_map[current_point[0]][current_point[1]].pathlength
-        for neighbor in neighbors:
-            #debug_write("Comparing champ {} and contender {}".format(ideal_neighbor, neighbor))
-            if not self.game_state.game_map.in_arena_bounds(neighbor) or self.game_map[neighbor[0]][neighbor[1]].blocked:
+        size = self.game_state.ARENA_SIZE
+        blocked = self._blocked
+        current_point = divmod(current_index, size)
+
+        ideal_neighbor = current_index
+        best_pathlength = self._get_pathlength(current_index)
+        for neighbor in self._neighbors[current_index]:
+            if blocked[neighbor]:
                 continue
 
-            new_best = False
-            x, y = neighbor
-            current_pathlength = self.game_map[x][y].pathlength
+            current_pathlength = self._get_pathlength(neighbor)
 
             #Filter by pathlength
             if current_pathlength > best_pathlength:
                 continue
-            elif current_pathlength < best_pathlength:
-                #debug_write("Contender has better pathlength at {} vs champs {}".format(current_pathlength, best_pathlength))
-                new_best = True
-
             #Filter by direction based on prev move
-            if not new_best and not self._better_direction(current_point, neighbor, ideal_neighbor, previous_move_direction, end_points):
+            if current_pathlength == best_pathlength and not self._better_direction(current_point, divmod(neighbor, size), divmod(ideal_neighbor, size), previous_move_direction, end_points):
                 continue
 
             ideal_neighbor = neighbor
             best_pathlength = current_pathlength
 
-        #debug_write("Gave unit at {} new tile {}".format(current_point, ideal_neighbor))
         return ideal_neighbor
 
     def _better_direction(self, prev_tile, new_tile, prev_best, previous_move_direction, end_points):
@@ -299,9 +669,9 @@ class ShortestPathFinder:
 
         for y in range(28):
             for x in range(28):
-                node = self.game_map[x][28 - y - 1]
-                if not node.blocked and not node.pathlength == -1:
-                    self._print_justified(node.pathlength)
+                index = x * self.game_state.ARENA_SIZE + 28 - y - 1
+                if not self._blocked[index] and not self._get_pathlength(index) == -1:
+                    self._print_justified(self._get_pathlength(index))
                 else:
                     sys.stderr.write("   ")
             debug_write("")
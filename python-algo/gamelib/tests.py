@@ -1,7 +1,10 @@
 import unittest
 import json
+import math
 from .game_state import GameState
 from .unit import GameUnit
+from .catalog import get_catalog
+from .navigation import PathCache
 
 class BasicTests(unittest.TestCase):
 
@@ -232,3 +235,600 @@ class BasicTests(unittest.TestCase):
         actual = game.project_future_bits(turns)
         self.assertAlmostEqual(actual, expected, 0, "Expected {} bits {} turns from now, got {}".format(expected, turns, actual))
 
+
+
+class MapTests(unittest.TestCase):
+
+    def make_turn_0_map(self):
+        config = """
+        {
+            "unitInformation":[
+                {"cost1":0.5, "getHitRadius":0.01, "display":"Filter", "shorthand":"FF", "startHealth":12.0, "unitCategory":0,
+                 "refundPercentage":0.75, "upgrade":{"cost1":1.5, "startHealth":120.0}},
+                {"cost1":4.0, "getHitRadius":0.01, "shieldPerUnit":3.0, "display":"Encryptor", "shieldRange":3.5, "shorthand":"EF",
+                 "startHealth":30.0, "unitCategory":0, "shieldBonusPerY":0.0, "refundPercentage":0.75,
+                 "upgrade":{"cost1":2, "shieldRange":7, "shieldPerUnit":2, "shieldBonusPerY":0.34}},
+                {"attackDamageWalker":16.0, "cost1":6.0, "getHitRadius":0.01, "display":"Destructor", "attackRange":3.5, "shorthand":"DF",
+                 "startHealth":75.0, "unitCategory":0, "refundPercentage":0.75, "upgrade":{"attackDamageWalker":32.0}},
+                {"attackDamageTower":2.0, "attackDamageWalker":2.0, "cost2":1.0, "getHitRadius":0.01, "display":"Ping",
+                 "attackRange":3.5, "shorthand":"PI", "startHealth":15.0, "speed":1, "unitCategory":1},
+                {"attackDamageWalker":16.0, "attackDamageTower":16.0, "cost2":3.0, "getHitRadius":0.01, "display":"EMP",
+                 "attackRange":4.5, "shorthand":"EI", "startHealth":5.0, "speed":1, "unitCategory":1},
+                {"attackDamageWalker":20.0, "cost2":1.0, "getHitRadius":0.01, "display":"Scrambler", "attackRange":4.5,
+                 "shorthand":"SI", "startHealth":40.0, "speed":0.25, "unitCategory":1},
+                {"display":"Remove", "shorthand":"RM"},
+                {"display":"Upgrade", "shorthand":"UP"}
+            ],
+            "resources":{
+                "turnIntervalForBitSchedule":10,
+                "bitGrowthRate":1.0,
+                "bitsPerRound":5.0,
+                "coresPerRound":5.0,
+                "bitDecayPerRound":0.25
+            }
+        }
+        """
+        turn_0 = """{"p2Units":[[],[],[],[],[],[],[],[]],"turnInfo":[0,0,-1],"p1Stats":[30.0,40.0,5.0,0],"p1Units":[[],[],[],[],[],[],[],[]],"p2Stats":[30.0,40.0,5.0,0],"events":{"selfDestruct":[],"breach":[],"damage":[],"shield":[],"move":[],"spawn":[],"death":[],"attack":[],"melee":[]}}"""
+
+        state = GameState(json.loads(config), turn_0)
+        state.suppress_warnings(True)
+        return state
+
+    def test_structure_planes(self):
+        game = self.make_turn_0_map()
+        game_map = game.game_map
+        planes = game_map.get_structure_planes()
+        index = game_map.cell_index([13, 5])
+        self.assertEqual(-1, planes["owner"][index], "An empty cell should have no owner")
+
+        game.attempt_spawn("DF", [13, 5])
+        self.assertEqual(0, planes["owner"][index], "The owner plane was not updated by attempt_spawn")
+        self.assertEqual(2, planes["unit_type"][index], "The unit type plane was not updated by attempt_spawn")
+        self.assertEqual(75.0, planes["health"][index], "The health plane was not updated by attempt_spawn")
+
+        game.attempt_upgrade([13, 5])
+        self.assertEqual(1, planes["upgraded"][index], "The upgraded plane was not updated by attempt_upgrade")
+        game_map.set_pending_removal([13, 5])
+        self.assertEqual(1, planes["pending_removal"][index], "The pending removal plane was not updated")
+
+        game_map.add_unit("PI", [13, 0])
+        self.assertEqual(-1, planes["owner"][game_map.cell_index([13, 0])], "Mobile units should not show up in the structure planes")
+        game_map.remove_unit([13, 5])
+        self.assertEqual(-1, planes["owner"][index], "The owner plane was not cleared by remove_unit")
+        self.assertEqual(0, planes["upgraded"][index], "The upgraded plane was not cleared by remove_unit")
+
+        game_map[14, 20] = [GameUnit("FF", game.config, 1, None, 14, 20)]
+        self.assertEqual(1, planes["owner"][game_map.cell_index([14, 20])], "The owner plane was not updated by __setitem__")
+        with self.assertRaises(TypeError):
+            planes["owner"][index] = 1
+
+    def test_parsed_structures(self):
+        game = self.make_turn_0_map()
+        turn_1 = """{"p2Units":[[[14,20,12.0,"3"]],[],[[13,19,75.0,"4"]],[],[],[],[[14,20,12.0,"5"]],[[13,19,75.0,"6"]]],"turnInfo":[0,1,-1],"p1Stats":[30.0,40.0,5.0,0],"p1Units":[[],[],[[13,5,40.0,"1"]],[],[],[],[],[]],"p2Stats":[30.0,40.0,5.0,0],"events":{}}"""
+        game = GameState(game.config, turn_1)
+        planes = game.game_map.get_structure_planes()
+        self.assertEqual(40.0, planes["health"][game.game_map.cell_index([13, 5])], "Parsed health is missing from the health plane")
+        self.assertEqual(1, planes["pending_removal"][game.game_map.cell_index([14, 20])], "Parsed removal is missing from the pending removal plane")
+        self.assertEqual(1, planes["upgraded"][game.game_map.cell_index([13, 19])], "Parsed upgrade is missing from the upgraded plane")
+
+    def test_arena_bounds(self):
+        game_map = self.make_turn_0_map().game_map
+        locations = [[x, y] for x in range(-2, 30) for y in range(-2, 30)]
+        expected = [game_map.in_arena_bounds(location) for location in locations]
+        self.assertEqual(420, sum(expected), "The arena should have 420 valid cells")
+        self.assertEqual(expected, game_map.in_arena_bounds_batch(locations), "Batch bounds checks disagree with in_arena_bounds")
+        self.assertTrue(game_map.in_arena_bounds([13, 0]))
+        self.assertTrue(game_map.in_arena_bounds((27, 13)))
+        self.assertFalse(game_map.in_arena_bounds([12, 0]))
+        self.assertFalse(game_map.in_arena_bounds([-1, 13]))
+        self.assertTrue(game_map.in_arena_bounds([13.0, 13.0]), "Float locations should still be supported")
+
+    def test_edges(self):
+        game_map = self.make_turn_0_map().game_map
+        edges = game_map.get_edges()
+        self.assertEqual([14, 27], edges[game_map.TOP_RIGHT][0])
+        self.assertEqual([0, 14], edges[game_map.TOP_LEFT][-1])
+        self.assertEqual([13, 0], edges[game_map.BOTTOM_LEFT][0])
+        self.assertEqual([27, 13], edges[game_map.BOTTOM_RIGHT][-1])
+        edges[game_map.BOTTOM_LEFT].append([5, 5])
+        self.assertEqual(14, len(game_map.get_edge_locations(game_map.BOTTOM_LEFT)), "Modifying returned edges should not change the map")
+
+        for edge in range(4):
+            for location in game_map.get_edge_locations(edge):
+                self.assertTrue(game_map.is_on_edge(location, edge))
+        self.assertFalse(game_map.is_on_edge([13, 0], game_map.BOTTOM_RIGHT))
+        self.assertTrue(game_map.is_friendly_spawn_edge([13, 0]))
+        self.assertTrue(game_map.is_friendly_spawn_edge((27, 13)))
+        self.assertFalse(game_map.is_friendly_spawn_edge([13, 1]))
+        self.assertFalse(game_map.is_friendly_spawn_edge([14, 27]))
+
+    def test_locations_in_range_batch(self):
+        game_map = self.make_turn_0_map().game_map
+        centers = [[13, 13], [0, 13], [14, 27], [-500, -500]]
+        expected = [game_map.get_locations_in_range(center, 3.5) for center in centers]
+        self.assertEqual(expected, game_map.get_locations_in_range_batch(centers, 3.5), "Batch range queries disagree with get_locations_in_range")
+        self.assertEqual([], expected[3], "Invalid tiles are being marked as in range")
+        self.assertEqual(37, len(expected[0]), "Wrong number of tiles in range")
+        expected[0].append([0, 0])
+        self.assertEqual(37, len(game_map.get_locations_in_range([13, 13], 3.5)), "Modifying a result should not change the cached stencil")
+
+    def test_map_iteration(self):
+        game_map = self.make_turn_0_map().game_map
+        locations = list(game_map)
+        self.assertEqual(420, len(locations), "Iterating over the map should visit every valid location")
+        self.assertEqual([13, 0], locations[0])
+        self.assertEqual([14, 27], locations[-1])
+        nested = [(outer, inner) for outer in game_map for inner in game_map]
+        self.assertEqual(420 * 420, len(nested), "Nested iteration over the map should be independent")
+
+    def test_occupied_locations(self):
+        game_map = self.make_turn_0_map().game_map
+        self.assertEqual([], list(game_map.occupied_locations()))
+        game_map.add_unit("FF", [14, 20], 1)
+        game_map.add_unit("DF", [13, 5], 0)
+        game_map.add_unit("PI", [13, 0], 0)
+        game_map.add_unit("PI", [13, 0], 0)
+        self.assertEqual([[13, 0], [13, 5], [14, 20]], list(game_map.occupied_locations()), "Occupied locations should follow map order")
+        self.assertEqual([[13, 5], [14, 20]], list(game_map.occupied_locations(stationary=True)))
+        self.assertEqual([[13, 0]], list(game_map.occupied_locations(stationary=False)))
+        self.assertEqual([[14, 20]], list(game_map.occupied_locations(player_index=1)))
+        self.assertEqual([[13, 5]], list(game_map.occupied_locations(player_index=0, stationary=True)))
+        game_map.remove_unit([13, 5])
+        game_map[13, 0] = []
+        self.assertEqual([[14, 20]], list(game_map.occupied_locations()))
+
+    def test_fork(self):
+        game = self.make_turn_0_map()
+        game_map = game.game_map
+        game_map.add_unit("FF", [13, 5], 0)
+        game_map.add_unit("DF", [14, 20], 1)
+        game_map.add_unit("PI", [13, 0], 0)
+
+        fork = game_map.fork()
+        self.assertIs(game_map[13, 5][0], fork[13, 5][0], "Unchanged cells should be shared between a map and its fork")
+
+        fork.add_unit("EF", [12, 5], 0)
+        fork.add_unit("PI", [13, 0], 0)
+        fork.remove_unit([14, 20])
+        fork.upgrade([13, 5])
+        self.assertEqual([], game_map[12, 5], "Adding a unit to a fork should not change the parent")
+        self.assertEqual(1, len(game_map[13, 0]), "Stacking units in a fork should not change the parent")
+        self.assertEqual(1, len(game_map[14, 20]), "Removing a unit from a fork should not change the parent")
+        self.assertFalse(game_map[13, 5][0].upgraded, "Upgrading a unit in a fork should not change the parent")
+        self.assertTrue(fork[13, 5][0].upgraded)
+        self.assertEqual(0, game_map.get_structure_planes()["upgraded"][game_map.cell_index([13, 5])])
+        self.assertEqual(1, fork.get_structure_planes()["upgraded"][fork.cell_index([13, 5])])
+
+        game_map.set_pending_removal([14, 20])
+        self.assertEqual([], fork[14, 20])
+        game_map.add_unit("PI", [13, 0], 0)
+        self.assertEqual(2, len(fork[13, 0]), "Changing the parent should not change the fork")
+        self.assertEqual([[12, 5], [13, 5]], list(fork.occupied_locations(stationary=True)))
+
+    def test_rollback(self):
+        game = self.make_turn_0_map()
+        game_map = game.game_map
+        game_map.add_unit("FF", [13, 5], 0)
+        game_map.add_unit("DF", [14, 20], 1)
+        planes = game_map.get_structure_planes()
+        before = [list(plane) for plane in planes.values()]
+        filter_unit = game_map[13, 5][0]
+
+        game_map.begin()
+        game_map.add_unit("EF", [12, 5], 0)
+        game_map.upgrade([13, 5])
+        game_map.begin()
+        game_map.remove_unit([14, 20])
+        game_map.add_unit("PI", [13, 0], 0)
+        game_map.rollback()
+        self.assertEqual(1, len(game_map[14, 20]), "The inner rollback should restore removed units")
+        self.assertEqual([], game_map[13, 0], "The inner rollback should remove added units")
+        self.assertEqual(1, len(game_map[12, 5]), "The inner rollback should keep changes from the outer transaction")
+        game_map.rollback()
+
+        self.assertEqual([], game_map[12, 5])
+        self.assertIs(filter_unit, game_map[13, 5][0])
+        self.assertFalse(filter_unit.upgraded, "Rolling back an upgrade should leave the original unit untouched")
+        self.assertEqual(before, [list(plane) for plane in planes.values()], "The structure planes should roll back with the map")
+        self.assertEqual([[13, 5], [14, 20]], list(game_map.occupied_locations()))
+
+        game_map.begin()
+        game_map.remove_unit([13, 5])
+        game_map.commit()
+        self.assertEqual([], game_map[13, 5], "Committed changes should stay on the map")
+
+    def test_structure_index(self):
+        game = self.make_turn_0_map()
+        game_map = game.game_map
+        game_map.add_unit("DF", [14, 20], 1)
+        game_map.add_unit("DF", [13, 19], 1)
+        game_map.add_unit("FF", [13, 20], 1)
+        game_map.add_unit("FF", [13, 5], 0)
+        game_map.add_unit("PI", [13, 0], 1)
+        game_map.upgrade([14, 20])
+
+        self.assertEqual([[13, 19], [14, 20]], game_map.structure_locations(1, "DF"))
+        self.assertEqual([[14, 20]], game_map.structure_locations(1, "DF", upgraded=True))
+        self.assertEqual([[13, 19], [13, 20], [14, 20]], game_map.structure_locations(1))
+        self.assertEqual(3, game_map.count_units(1))
+        self.assertEqual(1, game_map.count_units(0, "FF"))
+        self.assertEqual(0, game_map.count_units(1, "PI"), "Information units should not be indexed")
+        self.assertEqual([game_map[13, 19][0], game_map[14, 20][0]], game_map.units_of(1, "DF"))
+
+        fork = game_map.fork()
+        fork.remove_unit([13, 19])
+        self.assertEqual(1, fork.count_units(1, "DF"))
+        self.assertEqual(2, game_map.count_units(1, "DF"), "Changing a fork should not change the parent's index")
+        game_map.begin()
+        game_map[13, 20] = []
+        game_map.add_unit("DF", [14, 19], 1)
+        self.assertEqual(3, game_map.count_units(1, "DF"))
+        game_map.rollback()
+        self.assertEqual([[13, 20]], game_map.structure_locations(1, "FF"), "The index should roll back with the map")
+        self.assertEqual(2, game_map.count_units(1, "DF"))
+
+    def test_board_hash(self):
+        game_map = self.make_turn_0_map().game_map
+        self.assertEqual(0, game_map.board_hash())
+        game_map.add_unit("FF", [13, 5], 0)
+        game_map.add_unit("PI", [13, 0], 0)
+        board_hash = game_map.board_hash()
+        blocking_hash = game_map.blocking_hash()
+
+        game_map.begin()
+        game_map.add_unit("PI", [13, 0], 0)
+        self.assertNotEqual(board_hash, game_map.board_hash(), "Stacking information units should change the board hash")
+        self.assertEqual(blocking_hash, game_map.blocking_hash(), "Information units should not change the blocking hash")
+        game_map.upgrade([13, 5])
+        upgraded_hash = game_map.board_hash()
+        game_map.set_pending_removal([13, 5])
+        self.assertNotEqual(upgraded_hash, game_map.board_hash(), "Flagging a removal should change the board hash")
+        self.assertEqual(blocking_hash, game_map.blocking_hash())
+        game_map.add_unit("DF", [14, 20], 1)
+        self.assertNotEqual(blocking_hash, game_map.blocking_hash(), "New structures should change the blocking hash")
+        game_map.rollback()
+        self.assertEqual(board_hash, game_map.board_hash(), "The board hash should roll back with the map")
+        self.assertEqual(blocking_hash, game_map.blocking_hash(), "The blocking hash should roll back with the map")
+
+        other = self.make_turn_0_map().game_map
+        other.add_unit("PI", [13, 0], 0)
+        other.add_unit("EF", [13, 5], 0)
+        other.add_unit("FF", [13, 5], 0)
+        self.assertEqual(board_hash, other.board_hash(), "Equal boards built in a different order should hash the same")
+        fork = other.fork()
+        fork.remove_unit([13, 0])
+        self.assertEqual(board_hash, other.board_hash())
+        self.assertEqual(blocking_hash, fork.blocking_hash())
+
+    def test_bitboards(self):
+        game_map = self.make_turn_0_map().game_map
+        game_map.add_unit("FF", [0, 14], 1)
+        game_map.add_unit("DF", [1, 15], 1)
+        game_map.add_unit("FF", [26, 14], 1)
+        game_map.add_unit("FF", [13, 5], 0)
+        game_map.add_unit("PI", [13, 0], 0)
+
+        self.assertEqual([[13, 5], [0, 14], [26, 14], [1, 15]], game_map.bits_to_locations(game_map.structure_bits()))
+        self.assertEqual([[0, 14], [26, 14]], game_map.bits_to_locations(game_map.structure_bits(1, "FF")))
+        left_corner = game_map.get_region_bits("left_corner") & game_map.get_region_bits("top_half")
+        self.assertEqual(2, game_map.count_structures_in(left_corner, 1))
+        self.assertEqual(1, game_map.count_structures_in(left_corner, 1, "DF"))
+        self.assertEqual(0, game_map.count_structures_in(game_map.get_region_bits("bottom_half"), 1))
+        self.assertEqual(14, len(game_map.bits_to_locations(game_map.get_region_bits("top_left_edge"))))
+
+        corridor = game_map.location_bits([[13, 4], [13, 5], [13, 6], [-1, 0]])
+        self.assertEqual(3, len(game_map.bits_to_locations(corridor)), "Off-board locations should be ignored")
+        self.assertTrue(game_map.is_region_blocked(corridor))
+        game_map.begin()
+        game_map.remove_unit([13, 5])
+        self.assertFalse(game_map.is_region_blocked(corridor))
+        game_map.rollback()
+        self.assertTrue(game_map.is_region_blocked(corridor), "Bitboards should roll back with the map")
+        fork = game_map.fork()
+        fork.add_unit("EF", [13, 5], 0)
+        self.assertEqual(0, game_map.structure_bits(0, "EF"), "Changing a fork should not change the parent's bitboards")
+        self.assertEqual(game_map.structure_bits(), fork.structure_bits())
+
+    def test_damage_grid(self):
+        game_map = self.make_turn_0_map().game_map
+        game_map.add_unit("DF", [14, 17], 1)
+        game_map.add_unit("DF", [14, 18], 1)
+        game_map.add_unit("FF", [15, 17], 1)
+        grid = game_map.get_damage_grid(1)
+        for location in game_map:
+            expected = 16.0 * sum(1 for destructor in [[14, 17], [14, 18]]
+                                  if game_map.distance_between_locations(location, destructor) < 3.51)
+            self.assertEqual(expected, grid[game_map.cell_index(location)], "Wrong damage at {}".format(location))
+        self.assertEqual(0, sum(game_map.get_damage_grid(0)), "Enemy structures should not count towards my damage")
+
+        game_map.begin()
+        game_map.upgrade([14, 17])
+        self.assertEqual(48.0, game_map.damage_at([14, 16], 1), "Upgraded destructors should deal upgraded damage")
+        game_map.remove_unit([14, 18])
+        self.assertEqual(32.0, game_map.damage_at([14, 16], 1))
+        game_map.rollback()
+        self.assertEqual(32.0, game_map.damage_at([14, 16], 1), "The damage grid should roll back with the map")
+        self.assertEqual(32.0 + 32.0 + 16.0, game_map.path_damage([[14, 16], [14, 15], [14, 14]], 1))
+        self.assertEqual(16.0, game_map.damage_at([14.5, 13.6], 1), "Locations between cells should not be truncated")
+        self.assertEqual(0.0, game_map.damage_at([-1, 14], 1), "Locations off the board should not wrap around")
+        self.assertEqual(16.0, game_map.path_damage([[14.5, 13.6], [0, 0]], 1))
+
+    def test_shield_grid(self):
+        game_map = self.make_turn_0_map().game_map
+        game_map.add_unit("EF", [13, 2], 0)
+        game_map.add_unit("EF", [20, 8], 0)
+        game_map.add_unit("EF", [13, 25], 1)
+        grid = game_map.get_shield_grid(0)
+        self.assertEqual(3.0, grid[game_map.cell_index([13, 4])])
+        self.assertEqual(0.0, grid[game_map.cell_index([13, 7])])
+        self.assertEqual(3.0, game_map.shield_at([14, 25], 1))
+
+        path = [[13, 0], [13, 1], [13, 2], [13, 3], [13, 4], [13, 5]]
+        self.assertEqual(3.0, game_map.path_shield(path, 0), "An encryptor should only shield a unit once")
+        self.assertEqual(0.0, game_map.path_shield(path, 1))
+        self.assertEqual(0.0, game_map.shield_at([13, 5.6], 0), "Locations between cells should not be truncated")
+        self.assertEqual(3.0, game_map.path_shield([[13.2, 5.4], [13, 5.6], [28, 0]], 0))
+
+        game_map.begin()
+        game_map.upgrade([13, 2])
+        self.assertEqual(2 + 0.34 * 2, game_map.path_shield(path, 0), "Upgraded encryptors should use upgraded shielding")
+        self.assertEqual(2 + 0.34 * 2, game_map.shield_at([13, 8], 0), "Upgraded encryptors should use their upgraded range")
+        game_map.rollback()
+        self.assertEqual(0.0, game_map.shield_at([13, 8], 0), "The shield grid should roll back with the map")
+        game_map.remove_unit([13, 2])
+        self.assertEqual(0.0, game_map.path_shield(path, 0))
+
+    def test_distance_table(self):
+        game_map = self.make_turn_0_map().game_map
+        self.assertEqual(0, game_map.cell_id([13, 0]))
+        self.assertEqual(419, game_map.cell_id([14, 27]))
+        self.assertIsNone(game_map.cell_id([0, 0]))
+        self.assertEqual(420 * 420, len(game_map.get_distance_table()))
+        self.assertEqual(5, game_map.lookup_distance([10, 5], [14, 8]))
+        self.assertAlmostEqual(game_map.distance_between_locations([0, 13], [27, 14]), game_map.lookup_distance([0, 13], [27, 14]), 5)
+        self.assertEqual(5, game_map.lookup_distance([-4, -3], [0, 0]), "Off-board locations should fall back to distance_between_locations")
+        self.assertTrue(game_map.is_within_distance([13, 13], [13, 16], 3))
+        self.assertFalse(game_map.is_within_distance([13, 13], [14, 16], 3))
+        within = game_map.locations_within_distance([13, 13], 3.5)
+        self.assertEqual(sorted(game_map.get_locations_in_range([13, 13], 3.5)), sorted(within))
+
+        self.assertIsNone(game_map.cell_id([13.5, 5.5]), "Locations between cells have no cell id")
+        self.assertEqual(game_map.cell_id([13, 5]), game_map.cell_id([13.0, 5.0]))
+        self.assertAlmostEqual(math.sqrt(0.5), game_map.lookup_distance([13.5, 5.5], [13, 5]))
+        self.assertEqual([[13, 5], [14, 5]], game_map.locations_within_distance([13.5, 5], 0.5))
+        row = game_map.get_distance_row([10, 5])
+        self.assertEqual(5, row[game_map.get_cell_ids()[game_map.cell_index([14, 8])]])
+        self.assertIsNone(game_map.get_distance_row([10.5, 5]))
+
+        for squared in (2, 5, 8, 13):
+            exact = [location for location in game_map if game_map.distance_between_locations([13, 13], location) <= math.sqrt(squared)]
+            self.assertEqual(exact, game_map.locations_within_distance([13, 13], math.sqrt(squared)),
+                             "Locations exactly sqrt({}) away should be within that distance".format(squared))
+        self.assertTrue(game_map.is_within_distance([13, 13], [14, 15], math.sqrt(5)))
+
+    def test_region_counts(self):
+        game = self.make_turn_0_map()
+        game_map = game.game_map
+        for location in [[0, 14], [1, 14], [2, 15], [26, 14]]:
+            game_map.add_unit("FF", location, 1)
+        game_map.add_unit("DF", [3, 16], 1)
+        game_map.add_unit("DF", [13, 5], 0)
+
+        self.assertEqual(4, game.count_in_region(0, 14, 13, 27))
+        self.assertEqual(3, game.count_in_region(0, 14, 13, 27, 1, "FF"))
+        self.assertEqual(2, game.count_in_region(0, 14, 3, 14))
+        self.assertEqual(1, game.count_in_region(-5, -5, 40, 40, 0), "Rectangles should be clipped to the map")
+        self.assertEqual(0, game.count_in_region(5, 5, 4, 4))
+        self.assertEqual(6, game.weighted_region_sum(0, 14, 13, 27, {"FF": 1, "DF": 3}, 1))
+
+        version = game_map.placement_version()
+        game_map.upgrade([1, 14])
+        game_map.set_pending_removal([2, 15])
+        self.assertEqual(version, game_map.placement_version(), "Upgrades and removal flags should keep the region tables")
+        game_map.remove_unit([0, 14])
+        self.assertNotEqual(version, game_map.placement_version())
+        self.assertEqual(2, game.count_in_region(0, 14, 13, 27, 1, "FF"), "Region counts should be refreshed when the map changes")
+        game.game_map = game_map.fork()
+        game.game_map.add_unit("FF", [0, 14], 1)
+        self.assertEqual(3, game.count_in_region(0, 14, 13, 27, 1, "FF"), "Region counts should follow a replaced map")
+
+    def test_get_attackers(self):
+        game = self.make_turn_0_map()
+        game_map = game.game_map
+        self.assertEqual([], game.get_attackers([13, 13], 0), "Are we being attacked by a ghost?")
+        game_map.add_unit("DF", [12, 12], 0)
+        self.assertEqual([], game.get_attackers([13, 13], 0), "Are we being attacked by a friend?")
+        game_map.add_unit("EF", [13, 14], 1)
+        game_map.add_unit("FF", [14, 14], 1)
+        self.assertEqual([], game.get_attackers([13, 13], 0), "Only units that deal damage should attack")
+        game_map.add_unit("DF", [12, 15], 1)
+        game_map.add_unit("DF", [13, 16], 1)
+        self.assertEqual([game_map[12, 15][0], game_map[13, 16][0]], game.get_attackers([13, 13], 0))
+        game_map.add_unit("DF", [13, 17], 1)
+        self.assertEqual(2, len(game.get_attackers([13, 13], 0)), "A destructor 4 tiles away should be out of range")
+        self.assertEqual([game_map[12, 12][0]], game.get_attackers([13, 13], 1))
+        self.assertEqual([game_map[12, 15][0], game_map[13, 16][0], game_map[13, 17][0]], game.get_attackers([13, 13.6], 0),
+                         "Locations between cells should not be truncated")
+
+        path = [[13, 13], [13, 12], [13, 11], [13, 10]]
+        self.assertEqual([game.get_attackers(location, 0) for location in path], game.get_attackers_batch(path, 0))
+        game_map.begin()
+        game_map.remove_unit([12, 15])
+        self.assertEqual([game_map[13, 16][0]], game.get_attackers([13, 13], 0))
+        game_map.rollback()
+        self.assertEqual(2, len(game.get_attackers([13, 13], 0)), "The threat index should roll back with the map")
+
+    def test_get_targets(self):
+        game = self.make_turn_0_map()
+        game_map = game.game_map
+        game_map.add_unit("DF", [13, 11], 0)
+        game_map.add_unit("PI", [12, 10], 0)
+        game_map.add_unit("FF", [12, 14], 1)
+        game_map.add_unit("FF", [14, 14], 1)
+        game_map.add_unit("PI", [13, 14], 1)
+        game_map.add_unit("PI", [13, 14], 1, 10)
+        game_map.add_unit("EI", [15, 15], 1)
+        units = [unit for location in game_map for unit in game_map[location]]
+        self.assertEqual([game.get_target(unit) for unit in units], game.get_targets(units))
+        self.assertIs(game_map[13, 14][1], game.get_targets([game_map[13, 11][0]])[0], "The weakest ping should be targeted")
+        self.assertEqual([None], game.get_targets([game_map[12, 10][0]], [game_map[13, 11][0]]), "Friendly units are not targets")
+
+    def test_catalog(self):
+        game = self.make_turn_0_map()
+        catalog = game.catalog
+        self.assertIs(catalog, get_catalog(game.config), "The catalog should be compiled once per config")
+        self.assertEqual(("FF", "EF", "DF"), catalog.firewall_types)
+        self.assertEqual(2, catalog.type_index["DF"])
+        self.assertEqual([6.0, 0], game.type_cost("DF"))
+        self.assertEqual([6.0, 0], game.type_cost("DF", True), "A resource missing from an upgrade costs the same as the unit")
+        self.assertEqual([1.5, 0], game.type_cost("FF", True))
+        self.assertEqual(4.5, catalog.max_attack_range)
+        self.assertEqual(7, catalog.max_shield_range)
+        self.assertEqual(0.375, catalog.refund("FF"))
+
+        unit = GameUnit("DF", game.config, 0, None, 13, 13)
+        self.assertEqual(catalog.stats("DF").damage_i, unit.damage_i)
+        unit.upgrade()
+        self.assertEqual(32.0, unit.damage_i)
+        self.assertEqual([6.0, 0], unit.cost)
+        self.assertEqual((2.0, 0), catalog.stats("FF", True).cost, "An upgraded unit should cost the base and upgrade costs")
+        self.assertEqual(catalog.stats("PI"), catalog.stats("PI", True), "A unit without an upgrade keeps its stats")
+
+    def test_unit_flyweight(self):
+        game = self.make_turn_0_map()
+        first = GameUnit("DF", game.config, 0, None, 13, 13)
+        second = GameUnit("DF", game.config, 1, 10, 13, 14)
+        self.assertFalse(hasattr(first, "__dict__"), "GameUnit should not have a per-instance dict")
+        self.assertIs(first._stats, second._stats, "Units of the same type should share their stats")
+        self.assertEqual((16.0, 3.5, 75.0, 10), (second.damage_i, second.attackRange, second.max_health, second.health))
+        self.assertIs(game.config, first.config)
+        second.upgrade()
+        self.assertEqual((16.0, 32.0), (first.damage_i, second.damage_i), "Upgrading a unit should not change other units")
+        with self.assertRaises(AttributeError):
+            first.damage_i = 0
+
+    def test_attempt_plan(self):
+        sequential = self.make_turn_0_map()
+        planned = self.make_turn_0_map()
+        filters = [[0, 13], [1, 13], [13, 13], [13, 20]]
+        self.assertEqual(4, sequential.attempt_spawn("DF", [[13, 5], [14, 5], [13, 6], [14, 6], [13, 5]]))
+        self.assertEqual(3, sequential.attempt_spawn("FF", filters))
+        self.assertEqual(3, sequential.attempt_upgrade(filters))
+        self.assertEqual(1, sequential.attempt_remove([13, 5]))
+        self.assertEqual(2, sequential.attempt_spawn("PI", [[13, 0], [13, 5]], 2))
+        results = planned.attempt_plan([
+            ("spawn", "DF", [[13, 5], [14, 5], [13, 6], [14, 6], [13, 5]]),
+            ("spawn", "FF", filters),
+            ("upgrade", None, filters),
+            ("remove", None, [13, 5]),
+            ("spawn", "PI", [[13, 0], [13, 5]], 2)])
+        self.assertEqual([4, 3, 3, 1, 2], results)
+        self.assertEqual(sequential._build_stack, planned._build_stack)
+        self.assertEqual(sequential._deploy_stack, planned._deploy_stack)
+        self.assertEqual(sequential.get_resources(), planned.get_resources())
+        self.assertEqual([None], planned.attempt_plan([("spawn", "XX", [13, 0])]), "An invalid unit should not spawn")
+
+    def test_legal_actions(self):
+        game = self.make_turn_0_map()
+        game_map = game.game_map
+        game.suppress_warnings(True)
+        legal = game.get_legal_actions()
+        for unit_type in ["FF", "EF", "DF", "PI", "EI", "SI"]:
+            spawnable = game_map.location_bits([location for location in game_map if game.can_spawn(unit_type, location)])
+            self.assertEqual(spawnable, legal["build" if unit_type in ["FF", "EF", "DF"] else "deploy"][unit_type])
+        self.assertIs(legal, game.get_legal_actions(), "Legal actions should be kept until the map or resources change")
+
+        game.attempt_spawn("FF", [13, 5])
+        legal = game.get_legal_actions()
+        self.assertEqual([[13, 5]], game_map.bits_to_locations(legal["remove"]))
+        self.assertEqual([[13, 5]], game_map.bits_to_locations(legal["upgrade"]))
+        self.assertFalse(legal["build"]["DF"] & game_map.location_bits([[13, 5]]), "A built location should not be buildable")
+        game.attempt_upgrade([13, 5])
+        self.assertEqual(0, game.get_legal_actions()["upgrade"])
+
+    def test_pathing(self):
+        game = self.make_turn_0_map()
+        game_map = game.game_map
+        game_map.add_unit("FF", [14, 1], 0)
+        game_map.add_unit("FF", [13, 2], 0)
+        path = game.find_path_to_edge([13, 0])
+        self.assertEqual([[13, 0], [13, 1], [12, 1], [12, 2], [12, 3], [13, 3], [13, 4], [14, 4], [14, 5], [15, 5]], path[:10])
+        self.assertTrue(game_map.is_on_edge(path[-1], game_map.TOP_RIGHT), "The path should end on the target edge")
+        self.assertIsNone(game.find_path_to_edge([13, 2]), "There is no path from a blocked location")
+        game_map.add_unit("FF", [12, 1], 0)
+        self.assertEqual([[13, 0], [13, 1]], game.find_path_to_edge([13, 0]), "A boxed in unit should self destruct at its most ideal location")
+
+    def test_pathfinder_reuse(self):
+        game = self.make_turn_0_map()
+        game_map = game.game_map
+        finder = game._shortest_path_finder
+        open_path = game.find_path_to_edge([13, 0])
+        blocked = finder._blocked
+        game_map.add_unit("FF", [13, 1], 0)
+        game_map.add_unit("FF", [12, 1], 0)
+        game_map.add_unit("FF", [14, 1], 0)
+        self.assertEqual([[13, 0], [14, 0]], game.find_path_to_edge([13, 0]), "New walls should be picked up by the next search")
+        self.assertIs(blocked, finder._blocked, "The pathfinder buffers should be reused")
+        game_map.remove_unit([12, 1])
+        game_map.remove_unit([13, 1])
+        game_map.remove_unit([14, 1])
+        self.assertEqual(open_path, game.find_path_to_edge([13, 0]))
+
+    def test_path_cache(self):
+        game = self.make_turn_0_map()
+        game.path_cache = PathCache(2)
+        path = game.find_path_to_edge([13, 0])
+        self.assertEqual((0, 1), (game.path_cache.hits, game.path_cache.misses))
+        cached = game.find_path_to_edge([13, 0])
+        self.assertEqual(path, cached)
+        self.assertEqual((1, 1), (game.path_cache.hits, game.path_cache.misses))
+        cached[1][0] = 0
+        self.assertEqual(path, game.find_path_to_edge([13, 0]), "Changing a returned path should not change the cache")
+
+        game.game_map.add_unit("FF", [13, 1], 0)
+        self.assertNotEqual(path, game.find_path_to_edge([13, 0]), "A new wall should change the cache key")
+        game.find_path_to_edge([14, 0])
+        self.assertEqual(2, len(game.path_cache), "The cache should stay within its size")
+        game.game_map.remove_unit([13, 1])
+        self.assertEqual(path, game.find_path_to_edge([13, 0]))
+        self.assertEqual(2, game.path_cache.hits, "The original path should have been evicted")
+
+    def test_paths_from_all(self):
+        game = self.make_turn_0_map()
+        game.game_map.add_unit("FF", [13, 1], 0)
+        game.game_map.add_unit("FF", [14, 1], 0)
+        starts = [[13, 0], [14, 0], [3, 10], [20, 6], [14, 1]]
+        paths = game.paths_from_all(starts)
+        game.path_cache.clear()
+        for start, path in zip(starts[:-1], paths):
+            self.assertEqual(game.find_path_to_edge(start), path)
+        self.assertIsNone(paths[-1], "A blocked start should have no path")
+        top_right = game.game_map.TOP_RIGHT
+        self.assertEqual([game.find_path_to_edge(start, top_right) for start in starts[:-1]],
+                         game.paths_from_all(starts[:-1], top_right))
+
+    def test_distance_field(self):
+        game = self.make_turn_0_map()
+        field = game.get_distance_field(game.game_map.TOP_RIGHT)
+        self.assertEqual(0, field.distance([14, 27]))
+        self.assertEqual(15, field.distance([13, 13]))
+        base = [field.distance(location) for location in game.game_map]
+        self.assertEqual(-1, field.distance([0, 0]))
+
+        walls = [[x, 13] for x in range(28) if x != 1]
+        for wall in walls:
+            field.add_wall(wall)
+        for wall in walls:
+            game.game_map.add_unit("FF", wall, 0)
+        self.assertEqual(-1, field.distance(walls[0]))
+        self.assertEqual(list(game.get_distance_field(game.game_map.TOP_RIGHT).distance(location) for location in game.game_map),
+                         list(field.distance(location) for location in game.game_map))
+        self.assertEqual(40, field.distance([13, 12]), "The wall should force a detour through [1, 13]")
+
+        field.remove_wall([13, 13])
+        self.assertEqual(16, field.distance([13, 12]))
+        for wall in walls:
+            self.assertTrue(field.undo())
+        self.assertTrue(field.undo())
+        self.assertFalse(field.undo())
+        self.assertEqual(base, [field.distance(location) for location in game.game_map])
@@ -1,3 +1,8 @@
+from operator import attrgetter
+
+from .catalog import get_catalog
+
+
 def is_stationary(unit_type, firewall_types):
     """
         Args:
@@ -31,48 +36,41 @@ class GameUnit:
         * pending_removal (boolean): If this unit is marked for removal by its owner
         * upgraded (boolean): If this unit is upgraded
 
+    The type stats (stationary to shieldPerUnit and cost) are read-only, they change when the unit is upgraded.
+
     """
+    __slots__ = ("player_index", "x", "y", "health", "pending_removal", "upgraded", "_stats")
+
     def __init__(self, unit_type, config, player_index=None, health=None, x=-1, y=-1):
         """ Initialize unit variables using args passed
 
+        The type stats are not copied into the unit: every unit of the same type and upgrade state
+        shares one UnitStats record from the catalog, and the stat attributes read from it.
+
         """
-        self.unit_type = unit_type
-        self.config = config
         self.player_index = player_index
         self.pending_removal = False
         self.upgraded = False
         self.x = x
         self.y = y
-        self.__serialize_type()
+        self._stats = get_catalog(config).stats(unit_type)
         self.health = self.max_health if not health else health
 
-    def __serialize_type(self):
-        from .game_state import FIREWALL_TYPES, UNIT_TYPE_TO_INDEX, ENCRYPTOR
-        type_config = self.config["unitInformation"][UNIT_TYPE_TO_INDEX[self.unit_type]]
-        self.stationary = type_config["unitCategory"] == 0
-        self.speed = type_config.get("speed", 0)
-        self.damage_f = type_config.get("attackDamageTower", 0)
-        self.damage_i = type_config.get("attackDamageWalker", 0)
-        self.attackRange = type_config.get("attackRange", 0)
-        self.shieldRange = type_config.get("shieldRange", 0)
-        self.max_health = type_config.get("startHealth", 0)
-        self.shieldPerUnit = type_config.get("shieldPerUnit", 0)
-        self.cost = [type_config.get("cost1", 0), type_config.get("cost2", 0)]
-
-
     def upgrade(self):
-        from .game_state import UNIT_TYPE_TO_INDEX
-        type_config = self.config["unitInformation"][UNIT_TYPE_TO_INDEX[self.unit_type]].get("upgrade", {})
-        self.speed = type_config.get("speed", self.speed)
-        self.damage_f = type_config.get("attackDamageTower", self.damage_f)
-        self.damage_i = type_config.get("attackDamageWalker", self.damage_i)
-        self.attackRange = type_config.get("attackRange", self.attackRange)
-        self.shieldRange = type_config.get("shieldRange", self.shieldRange)
-        self.max_health = type_config.get("startHealth", self.max_health)
-        self.shieldPerUnit = type_config.get("shieldPerUnit", self.shieldPerUnit)
-        self.cost = [type_config.get("cost1", 0) + self.cost[0], type_config.get("cost2", 0) + self.cost[1]]
+        self._stats = self._stats.catalog.stats(self._stats.unit_type, True)
         self.upgraded = True
 
+    unit_type = property(attrgetter("_stats.unit_type"))
+    config = property(attrgetter("_stats.catalog.config"))
+    stationary = property(attrgetter("_stats.stationary"))
+    speed = property(attrgetter("_stats.speed"))
+    damage_f = property(attrgetter("_stats.damage_f"))
+    damage_i = property(attrgetter("_stats.damage_i"))
+    attackRange = property(attrgetter("_stats.attackRange"))
+    shieldRange = property(attrgetter("_stats.shieldRange"))
+    max_health = property(attrgetter("_stats.max_health"))
+    shieldPerUnit = property(attrgetter("_stats.shieldPerUnit"))
+    cost = property(lambda self: list(self._stats.cost))
 
     def __toString(self):
         owner = "Friendly" if self.player_index == 0 else "Enemy"